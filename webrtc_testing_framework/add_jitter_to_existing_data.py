@@ -3,57 +3,161 @@
 Script to add jitter data to existing sample results
 """
 
+import os
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pandas-only installs just rewrite the CSV
+    pa = None
+
+# Column layout of results files once jitter has been added
+COLUMN_ORDER = [
+    'Timestamp', 'Architecture', 'Num_Viewers', 'Packet_Loss_Rate',
+    'Presenter_Bandwidth', 'Repetition', 'Presenter_CPU_Avg', 'Presenter_CPU_Max',
+    'Presenter_Bandwidth_Usage', 'Avg_Latency_Ms', 'Min_Latency_Ms', 'Max_Latency_Ms',
+    'Avg_Jitter_Ms', 'Text_Legibility_Score', 'Test_Duration_Ms', 'Success', 'Error_Message'
+]
+
+# A missing jitter column is inserted right after this one
+JITTER_AFTER = COLUMN_ORDER[COLUMN_ORDER.index('Avg_Jitter_Ms') - 1]
+
+# Columns the jitter model depends on, and rows processed per chunk
+KEY_COLUMNS = ['Architecture', 'Num_Viewers', 'Packet_Loss_Rate', 'Presenter_Bandwidth']
+CHUNK_ROWS = 100_000
+
+# Low-cardinality labels are read straight into categoricals (integer codes)
+CATEGORY_DTYPES = {'Architecture': 'category', 'Presenter_Bandwidth': 'category'}
+
+# Free-text columns, kept as strings in the Parquet copy even in a chunk where
+# every cell is blank (timestamps stay exactly as written, unparsed)
+TEXT_COLUMNS = ['Timestamp', 'Error_Message']
+
+def parquet_schema(table):
+    """Schema of the Parquet copy, taken from the first chunk's table
+
+    Later chunks are cast to it: text columns are pinned to strings and the
+    categorical labels to one dictionary type, since a chunk's own types
+    depend on the values it happens to contain.
+    """
+    schema = table.schema
+    column_types = {col: pa.string() for col in TEXT_COLUMNS}
+    column_types.update({col: pa.dictionary(pa.int32(), pa.string()) for col in CATEGORY_DTYPES})
+    for col, column_type in column_types.items():
+        if col in schema.names:
+            schema = schema.set(schema.get_field_index(col), pa.field(col, column_type))
+    return schema
+
+@lru_cache(maxsize=None)
+def expected_jitter(architecture, num_viewers, packet_loss_rate, bandwidth):
+    """Deterministic part of the jitter model for one parameter combination.
+
+    Repeated combinations (every repetition of a test) are computed once
+    and then served from the cache.
+    """
+    base_jitter = 5.0  # Base jitter in ms
+
+    # Increase jitter with packet loss
+    packet_loss_factor = 1.0 + packet_loss_rate / 100.0 * 2.0
+
+    # Increase jitter with more viewers (P2P is more affected)
+    viewer_slope = 0.2 if architecture == 'P2P' else 0.1
+    viewer_factor = 1.0 + (num_viewers - 1) * viewer_slope
+
+    # Lower bandwidth increases jitter
+    bandwidth_factor = 6.0 / float(bandwidth.replace('mbit', ''))  # Inverse relationship
+
+    return base_jitter * packet_loss_factor * viewer_factor * bandwidth_factor
+
+def chunk_jitter(chunk, rng):
+    """Jitter values for one chunk of results, computed column-wise"""
+    # Evaluate the model once per distinct combination, then align to rows
+    combos = chunk[KEY_COLUMNS].drop_duplicates()
+    combos['Expected_Jitter'] = [
+        expected_jitter(*combo) for combo in combos.itertuples(index=False, name=None)
+    ]
+    expected = chunk[KEY_COLUMNS].merge(combos, on=KEY_COLUMNS, how='left')['Expected_Jitter'].to_numpy()
+
+    # Add some random variation
+    random_factor = 0.8 + rng.random(len(chunk)) * 0.4  # 0.8 to 1.2
+
+    return np.round(expected * random_factor, 2)
+
 def add_jitter_column():
-    # Read the existing data
-    df = pd.read_csv('results/sample_results.csv')
-    
+    results_path = 'results/sample_results.csv'
+    tmp_path = results_path + '.tmp'
+
     # Add jitter data based on realistic patterns
     # Jitter tends to correlate with packet loss and increase with more viewers
-    np.random.seed(42)  # For reproducible results
-    
-    jitter_values = []
-    for _, row in df.iterrows():
-        base_jitter = 5.0  # Base jitter in ms
-        
-        # Increase jitter with packet loss
-        packet_loss_factor = 1.0 + (row['Packet_Loss_Rate'] / 100.0) * 2.0
-        
-        # Increase jitter with more viewers (P2P is more affected)
-        if row['Architecture'] == 'P2P':
-            viewer_factor = 1.0 + (row['Num_Viewers'] - 1) * 0.2
-        else:
-            viewer_factor = 1.0 + (row['Num_Viewers'] - 1) * 0.1
-        
-        # Lower bandwidth increases jitter
-        bandwidth = float(row['Presenter_Bandwidth'].replace('mbit', ''))
-        bandwidth_factor = 6.0 / bandwidth  # Inverse relationship
-        
-        # Add some random variation
-        random_factor = 0.8 + np.random.random() * 0.4  # 0.8 to 1.2
-        
-        jitter = base_jitter * packet_loss_factor * viewer_factor * bandwidth_factor * random_factor
-        jitter_values.append(round(jitter, 2))
-    
-    # Add the jitter column
-    df['Avg_Jitter_Ms'] = jitter_values
-    
-    # Reorder columns to match expected format
-    column_order = [
-        'Timestamp', 'Architecture', 'Num_Viewers', 'Packet_Loss_Rate', 
-        'Presenter_Bandwidth', 'Repetition', 'Presenter_CPU_Avg', 'Presenter_CPU_Max',
-        'Presenter_Bandwidth_Usage', 'Avg_Latency_Ms', 'Min_Latency_Ms', 'Max_Latency_Ms',
-        'Avg_Jitter_Ms', 'Text_Legibility_Score', 'Test_Duration_Ms', 'Success', 'Error_Message'
-    ]
-    
-    df = df[column_order]
-    
-    # Save the updated data
-    df.to_csv('results/sample_results.csv', index=False)
-    print(f"Added jitter data to {len(df)} records")
-    print(f"Jitter range: {min(jitter_values):.2f} - {max(jitter_values):.2f} ms")
+    # The file is processed in fixed-size chunks, so memory use does not grow with its size
+    rng = np.random.default_rng(42)  # For reproducible results (use rng.spawn(k) for parallel workers)
+
+    # Check the layout once up front rather than inserting by position blindly
+    try:
+        header = pd.read_csv(results_path, nrows=0).columns
+    except pd.errors.EmptyDataError:  # not even a header line
+        header = pd.Index([])
+    required_columns = KEY_COLUMNS if 'Avg_Jitter_Ms' in header else KEY_COLUMNS + [JITTER_AFTER]
+    missing_columns = [col for col in required_columns if col not in header]
+    if missing_columns:
+        raise ValueError(f"Missing required columns in {results_path}: {missing_columns}")
+
+    num_records = 0
+    jitter_min = np.inf
+    jitter_max = -np.inf
+
+    # The typed Parquet copy (when PyArrow is available) is written alongside,
+    # one row group per chunk
+    parquet_path = results_path.replace('.csv', '.parquet')
+    parquet_tmp_path = parquet_path + '.tmp'
+    parquet_writer = None
+
+    try:
+        with open(tmp_path, 'w', newline='') as fout:
+            for i, chunk in enumerate(pd.read_csv(results_path, dtype=CATEGORY_DTYPES, chunksize=CHUNK_ROWS)):
+                # A header-only file still yields one empty chunk; it is written
+                # (so the output keeps its header) but has no jitter to compute
+                jitter_values = chunk_jitter(chunk, rng) if len(chunk) else np.empty(0)
+
+                # Place the jitter column at its position in the expected format
+                if 'Avg_Jitter_Ms' in chunk.columns:
+                    chunk['Avg_Jitter_Ms'] = jitter_values
+                else:
+                    chunk.insert(chunk.columns.get_loc(JITTER_AFTER) + 1, 'Avg_Jitter_Ms', jitter_values)
+
+                chunk.to_csv(fout, header=(i == 0), index=False)
+                if pa is not None:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if parquet_writer is None:
+                        parquet_writer = pq.ParquetWriter(parquet_tmp_path, parquet_schema(table))
+                    parquet_writer.write_table(table.cast(parquet_writer.schema))
+
+                if len(chunk):
+                    num_records += len(chunk)
+                    jitter_min = min(jitter_min, jitter_values.min())
+                    jitter_max = max(jitter_max, jitter_values.max())
+
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+        # Save the updated data
+        os.replace(tmp_path, results_path)
+        if parquet_writer is not None:
+            os.replace(parquet_tmp_path, parquet_path)
+    finally:
+        # On failure, leave the original files untouched and no partial output behind
+        if parquet_writer is not None:
+            parquet_writer.close()
+        for path in (tmp_path, parquet_tmp_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    print(f"Added jitter data to {num_records} records")
+    if num_records:
+        print(f"Jitter range: {jitter_min:.2f} - {jitter_max:.2f} ms")
 
 if __name__ == '__main__':
-    add_jitter_column()
\ No newline at end of file
+    add_jitter_column()
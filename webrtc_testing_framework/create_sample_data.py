@@ -3,95 +3,147 @@
 Create sample test data for demonstration purposes
 """
 
+import os
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
-def generate_sample_data():
-    """Generate realistic sample test data"""
-    
-    # Configuration matching the test framework
-    architectures = ['P2P', 'SFU']
-    num_viewers = [1, 2, 5, 10]
-    packet_loss_rates = [0, 1, 2, 5]
-    presenter_bandwidths = ['5mbit', '2mbit', '1mbit']
-    repetitions = 5
-    
-    data = []
-    base_time = datetime.now()
-    
-    for arch in architectures:
-        for viewers in num_viewers:
-            for loss_rate in packet_loss_rates:
-                for bandwidth in presenter_bandwidths:
-                    for rep in range(1, repetitions + 1):
-                        
-                        # Simulate realistic metrics based on architecture
-                        if arch == 'P2P':
-                            # P2P: CPU increases with viewers, affected by network conditions
-                            base_cpu = 10 + (viewers * 8)  # Linear increase
-                            cpu_variance = loss_rate * 2 + (1 if bandwidth == '1mbit' else 0) * 5
-                            cpu_avg = base_cpu + random.uniform(-cpu_variance, cpu_variance)
-                            cpu_max = cpu_avg * (1.2 + random.uniform(0, 0.3))
-                            
-                            # P2P: Latency starts low but degrades with packet loss
-                            base_latency = 25 + random.uniform(-5, 5)
-                            latency_penalty = loss_rate * (15 + viewers * 2)  # Compounds with viewers
-                            avg_latency = base_latency + latency_penalty
-                            
-                        else:  # SFU
-                            # SFU: CPU remains relatively flat
-                            base_cpu = 15 + random.uniform(-3, 3)  # Mostly constant
-                            cpu_variance = loss_rate * 0.5  # Less affected by network
-                            cpu_avg = base_cpu + random.uniform(-cpu_variance, cpu_variance)
-                            cpu_max = cpu_avg * (1.1 + random.uniform(0, 0.2))
-                            
-                            # SFU: Latency starts higher but more resilient
-                            base_latency = 35 + random.uniform(-3, 3)
-                            latency_penalty = loss_rate * 8  # Less steep increase
-                            avg_latency = base_latency + latency_penalty
-                        
-                        # Bandwidth usage (simplified)
-                        bw_multiplier = {'5mbit': 0.8, '2mbit': 0.95, '1mbit': 1.0}[bandwidth]
-                        bandwidth_usage = (viewers * 1.2 * bw_multiplier) + random.uniform(-0.2, 0.2)
-                        
-                        # Text legibility score (lower is better)
-                        # Affected by bandwidth and packet loss
-                        bw_score = {'5mbit': 0, '2mbit': 2, '1mbit': 8}[bandwidth]
-                        loss_score = loss_rate * (3 if arch == 'P2P' else 2)
-                        base_tls = bw_score + loss_score + random.uniform(-1, 2)
-                        text_legibility = max(0, base_tls)
-                        
-                        # Ensure values are realistic
-                        cpu_avg = max(0, min(100, cpu_avg))
-                        cpu_max = max(cpu_avg, min(100, cpu_max))
-                        avg_latency = max(10, avg_latency)
-                        bandwidth_usage = max(0, bandwidth_usage)
-                        text_legibility = max(0, min(50, text_legibility))
-                        
-                        record = {
-                            'Timestamp': (base_time + timedelta(minutes=len(data)*2)).isoformat(),
-                            'Architecture': arch,
-                            'Num_Viewers': viewers,
-                            'Packet_Loss_Rate': loss_rate,
-                            'Presenter_Bandwidth': bandwidth,
-                            'Repetition': rep,
-                            'Presenter_CPU_Avg': round(cpu_avg, 2),
-                            'Presenter_CPU_Max': round(cpu_max, 2),
-                            'Presenter_Bandwidth_Usage': round(bandwidth_usage, 2),
-                            'Avg_Latency_Ms': round(avg_latency, 1),
-                            'Min_Latency_Ms': round(avg_latency * 0.8, 1),
-                            'Max_Latency_Ms': round(avg_latency * 1.4, 1),
-                            'Text_Legibility_Score': round(text_legibility, 1),
-                            'Test_Duration_Ms': 60000,
-                            'Success': True,
-                            'Error_Message': ''
-                        }
-                        
-                        data.append(record)
-    
-    return pd.DataFrame(data)
+try:
+    import pyarrow as pa
+except ImportError:  # pandas-only installs just write the CSV
+    pa = None
+
+# Configuration matching the test framework
+ARCHITECTURES = ['P2P', 'SFU']
+NUM_VIEWERS = [1, 2, 5, 10]
+PACKET_LOSS_RATES = [0, 1, 2, 5]
+PRESENTER_BANDWIDTHS = ['5mbit', '2mbit', '1mbit']
+REPETITIONS = 5
+
+def generate_architecture_block(arch_code, seed):
+    """Generate the metric columns for every test of one architecture
+    
+    Blocks are independent, so they can be built in separate processes;
+    each one draws from its own seed so the streams never overlap.
+    """
+    
+    # Parameter grid for this architecture as flat NumPy columns, one row per
+    # test (repetition varies fastest, matching the nested test order)
+    viewer_idx, loss_idx, bw_idx, rep_idx = (
+        idx.ravel() for idx in np.indices((
+            len(NUM_VIEWERS), len(PACKET_LOSS_RATES), len(PRESENTER_BANDWIDTHS), REPETITIONS
+        ))
+    )
+    n = viewer_idx.size
+    
+    arch_idx = np.full(n, arch_code)
+    arch = np.array(ARCHITECTURES)[arch_idx]
+    viewers = np.array(NUM_VIEWERS)[viewer_idx]
+    loss_rate = np.array(PACKET_LOSS_RATES)[loss_idx]
+    bandwidth = np.array(PRESENTER_BANDWIDTHS)[bw_idx]
+    repetition = rep_idx + 1
+    is_p2p = arch == 'P2P'
+    
+    rng = np.random.default_rng(seed)
+    
+    # Draw every random variate up front, one bulk array per noise source.
+    # Ranges that differ by architecture scale a shared unit draw instead of
+    # drawing a separate array for each branch.
+    sfu_cpu_noise = rng.uniform(-3, 3, n)
+    cpu_noise = rng.uniform(-1, 1, n)  # scaled by cpu_variance
+    cpu_peak_noise = rng.random(n)  # scaled by the peak spread
+    latency_noise = rng.uniform(-1, 1, n)  # scaled by the latency spread
+    bandwidth_noise = rng.uniform(-0.2, 0.2, n)
+    tls_noise = rng.uniform(-1, 2, n)
+    
+    # Simulate realistic metrics based on architecture
+    # P2P: CPU increases with viewers, affected by network conditions
+    # SFU: CPU remains relatively flat
+    base_cpu = np.where(is_p2p, 10 + (viewers * 8), 15 + sfu_cpu_noise)
+    cpu_variance = np.where(
+        is_p2p,
+        loss_rate * 2 + (bandwidth == '1mbit') * 5,
+        loss_rate * 0.5  # Less affected by network
+    )
+    cpu_avg = base_cpu + cpu_noise * cpu_variance
+    cpu_max = cpu_avg * (np.where(is_p2p, 1.2, 1.1) + cpu_peak_noise * np.where(is_p2p, 0.3, 0.2))
+    
+    # P2P: Latency starts low but degrades with packet loss (compounds with viewers)
+    # SFU: Latency starts higher but more resilient
+    base_latency = np.where(is_p2p, 25, 35) + latency_noise * np.where(is_p2p, 5, 3)
+    latency_penalty = np.where(is_p2p, loss_rate * (15 + viewers * 2), loss_rate * 8)
+    avg_latency = base_latency + latency_penalty
+    
+    # Bandwidth usage (simplified)
+    bw_conditions = [bandwidth == '5mbit', bandwidth == '2mbit', bandwidth == '1mbit']
+    bw_multiplier = np.select(bw_conditions, [0.8, 0.95, 1.0])
+    bandwidth_usage = (viewers * 1.2 * bw_multiplier) + bandwidth_noise
+    
+    # Text legibility score (lower is better)
+    # Affected by bandwidth and packet loss
+    bw_score = np.select(bw_conditions, [0, 2, 8])
+    loss_score = loss_rate * np.where(is_p2p, 3, 2)
+    text_legibility = bw_score + loss_score + tls_noise
+    
+    # Ensure values are realistic
+    cpu_avg = np.clip(cpu_avg, 0, 100)
+    cpu_max = np.maximum(np.clip(cpu_max, None, 100), cpu_avg)
+    avg_latency = np.maximum(avg_latency, 10)
+    bandwidth_usage = np.maximum(bandwidth_usage, 0)
+    text_legibility = np.clip(text_legibility, 0, 50)
+    
+    return pd.DataFrame({
+        # Low-cardinality labels are stored as categoricals (integer codes)
+        'Architecture': pd.Categorical.from_codes(arch_idx, ARCHITECTURES),
+        'Num_Viewers': viewers,
+        'Packet_Loss_Rate': loss_rate,
+        'Presenter_Bandwidth': pd.Categorical.from_codes(bw_idx, PRESENTER_BANDWIDTHS),
+        'Repetition': repetition,
+        'Presenter_CPU_Avg': cpu_avg,
+        'Presenter_CPU_Max': cpu_max,
+        'Presenter_Bandwidth_Usage': bandwidth_usage,
+        'Avg_Latency_Ms': avg_latency,
+        'Min_Latency_Ms': avg_latency * 0.8,
+        'Max_Latency_Ms': avg_latency * 1.4,
+        'Text_Legibility_Score': text_legibility,
+        'Test_Duration_Ms': 60000,
+        'Success': True,
+        'Error_Message': ''
+    })
+
+def generate_sample_data(seed=42, workers=1):
+    """Generate realistic sample test data
+    
+    Each architecture block gets its own child of SeedSequence(seed), so the
+    output is reproducible and identical whether the blocks are generated
+    serially or across `workers` processes.
+    """
+    
+    arch_codes = range(len(ARCHITECTURES))
+    seeds = np.random.SeedSequence(seed).spawn(len(ARCHITECTURES))
+    
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            blocks = list(executor.map(generate_architecture_block, arch_codes, seeds))
+    else:
+        blocks = list(map(generate_architecture_block, arch_codes, seeds))
+    
+    df = pd.concat(blocks, ignore_index=True)
+    
+    # One test every two minutes from now, formatted as ISO 8601 in one pass
+    timestamps = pd.date_range(datetime.now(), periods=len(df), freq='2min').strftime('%Y-%m-%dT%H:%M:%S.%f')
+    df.insert(0, 'Timestamp', timestamps)
+    
+    return df.round({
+        'Presenter_CPU_Avg': 2,
+        'Presenter_CPU_Max': 2,
+        'Presenter_Bandwidth_Usage': 2,
+        'Avg_Latency_Ms': 1,
+        'Min_Latency_Ms': 1,
+        'Max_Latency_Ms': 1,
+        'Text_Legibility_Score': 1
+    })
 
 def main():
     print("Generating sample WebRTC test data...")
@@ -99,23 +151,22 @@ def main():
     # Generate data
     df = generate_sample_data()
     
-    # Save to CSV
+    # Save to CSV (plus a typed Parquet copy when PyArrow is installed)
+    os.makedirs('results', exist_ok=True)
     df.to_csv('results/sample_results.csv', index=False)
     
     print(f"Generated {len(df)} sample records")
     print("Sample data saved to: results/sample_results.csv")
+    if pa is not None:
+        df.to_parquet('results/sample_results.parquet', index=False)
+        print("Parquet copy saved to: results/sample_results.parquet")
     
     # Show sample statistics
     print("\\nSample Statistics by Architecture:")
-    summary = df.groupby('Architecture').agg({
-        'Presenter_CPU_Avg': ['mean', 'std'],
-        'Avg_Latency_Ms': ['mean', 'std'], 
-        'Text_Legibility_Score': ['mean', 'std']
-    }).round(2)
+    summary_columns = ['Presenter_CPU_Avg', 'Avg_Latency_Ms', 'Text_Legibility_Score']
+    summary = df.groupby('Architecture', observed=True)[summary_columns].agg(['mean', 'std']).round(2)
     
     print(summary)
 
 if __name__ == '__main__':
-    import os
-    os.makedirs('results', exist_ok=True)
     main()
\ No newline at end of file
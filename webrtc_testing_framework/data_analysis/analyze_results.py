@@ -14,30 +14,347 @@ Author: WebRTC Testing Framework
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to files; skip interactive backend probing
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import re
+import hashlib
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 import logging
 from scipy.stats import ttest_ind
 
+try:
+    import pyarrow  # noqa: F401  (multithreaded CSV parser)
+    CSV_ENGINE = 'pyarrow'
+    CSV_OPTIONS = {}
+except ImportError:
+    # The C parser reads through mmap, so re-runs are served from the page cache
+    CSV_ENGINE = 'c'
+    CSV_OPTIONS = {'memory_map': True}
+
+try:
+    import polars as pl
+except ImportError:  # fall back to pandas' own CSV reader
+    pl = None
+if CSV_ENGINE != 'pyarrow':
+    pl = None  # polars' to_pandas needs the pyarrow found by the probe above
+
+if pl is not None:
+    POLARS_TYPES = {'category': pl.Categorical, 'int16': pl.Int16, 'float32': pl.Float32, 'boolean': pl.Boolean}
+    PARSE_ERRORS = (ValueError, pl.exceptions.PolarsError)
+else:
+    PARSE_ERRORS = (ValueError,)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# P2P vs SFU significance tests: the metric compared and the subset of tests
+# (column == value conditions) it is compared on
+STATISTICAL_TESTS = [
+    {
+        'title': 'Presenter CPU at N=10 viewers',
+        'rule_width': 40,
+        'metric': 'Presenter_CPU_Avg',
+        'conditions': {'Num_Viewers': 10},
+        'label': 'CPU (N=10)',
+        'unit': '%',
+        'insufficient': 'CPU comparison at N=10 viewers',
+    },
+    {
+        'title': 'G2G Latency at 5% packet loss (N=5 viewers)',
+        'rule_width': 50,
+        'metric': 'Avg_Latency_Ms',
+        'conditions': {'Num_Viewers': 5, 'Packet_Loss_Rate': 5},
+        'label': 'Latency (5% loss, N=5)',
+        'unit': 'ms',
+        'insufficient': 'latency comparison at 5% packet loss',
+    },
+    {
+        'title': 'Packets Lost at 1Mbps bandwidth',
+        'rule_width': 40,
+        'metric': 'Packets_Lost',
+        'conditions': {'Bandwidth_Mbps': 1},
+        'label': 'Packets Lost (1Mbps)',
+        'unit': '',
+        'insufficient': 'packets lost comparison at 1Mbps bandwidth',
+    },
+]
+
+# Columns read from the results CSV and their storage types; anything else in
+# the file (timestamps, min/max latency, error messages) is never parsed.
+# Success is nullable so a blank cell just marks the test as not successful
+RESULT_DTYPES = {
+    'Architecture': 'category',
+    'Num_Viewers': 'int16',
+    'Packet_Loss_Rate': 'float32',
+    'Presenter_Bandwidth': 'category',
+    'Presenter_Bandwidth_Usage': 'float32',
+    'Presenter_CPU_Avg': 'float32',
+    'Avg_Latency_Ms': 'float32',
+    'Avg_Jitter_Ms': 'float32',
+    'Packets_Lost': 'float32',
+    'Success': 'boolean',
+}
+
+# Figure aggregates: x-axis column -> metrics averaged per (Architecture, x) group
+FIGURE_AGGREGATES = {
+    'Num_Viewers': ['Presenter_CPU_Avg', 'Egress_Bandwidth_Mbps'],
+    'Packet_Loss_Rate': ['Avg_Latency_Ms', 'Avg_Jitter_Ms'],
+    'Bandwidth_Mbps': ['Packets_Lost'],
+}
+
+# Series styling shared by all figures
+ARCHITECTURES = ['P2P', 'SFU']
+COLORS = {'P2P': '#e74c3c', 'SFU': '#3498db'}
+MARKERS = {'P2P': 'o', 'SFU': 's'}
+
+@dataclass(frozen=True)
+class FigureSpec:
+    """Everything that differs between the mean ± std line figures."""
+    number: str
+    description: str
+    x: str
+    y: str
+    title: str
+    xlabel: str
+    ylabel: str
+    filename: str
+    annotation: str
+    labels: Dict[str, str] = field(default_factory=dict)  # legend label per architecture
+
+ERRORBAR_FIGURES = [
+    # Figure 6.1: Presenter CPU Utilization (%) vs. Number of Viewers
+    FigureSpec(
+        number='6.1',
+        description='CPU vs Viewers',
+        x='Num_Viewers',
+        y='Presenter_CPU_Avg',
+        title='Figure 6.1: Presenter CPU Utilization vs Number of Viewers',
+        xlabel='Number of Viewers',
+        ylabel='Presenter CPU Utilization (%)',
+        filename='presenter_cpu_vs_viewers.png',
+        annotation='Expected: P2P increases linearly\\nSFU remains flat and low',
+        labels={'P2P': 'P2P Mesh'},
+    ),
+    # Figure 6.2: Average G2G Latency (ms) vs. Packet Loss Rate (%), averaged
+    # across all viewer counts for each packet loss rate
+    FigureSpec(
+        number='6.2',
+        description='Latency vs Packet Loss',
+        x='Packet_Loss_Rate',
+        y='Avg_Latency_Ms',
+        title='Figure 6.2: Round-Trip Time vs Packet Loss Rate',
+        xlabel='Packet Loss Rate (%)',
+        ylabel='Average Round-Trip Time (ms)\n(SFU is Presenter-to-Server RTT)',
+        filename='latency_vs_packet_loss.png',
+        annotation='Expected: Both should have non-zero RTT.\\nSFU may show better resilience to packet loss.',
+        labels={'P2P': 'P2P (N=5)', 'SFU': 'SFU (N=5)'},
+    ),
+    # Figure 6.4: Estimated Total Egress Bandwidth (Mbps) vs. Number of Viewers
+    FigureSpec(
+        number='6.4',
+        description='Egress Bandwidth vs Viewers',
+        x='Num_Viewers',
+        y='Egress_Bandwidth_Mbps',
+        title='Figure 6.4: Estimated Total Egress Bandwidth vs Number of Viewers',
+        xlabel='Number of Viewers',
+        ylabel='Estimated Total Egress Bandwidth (Mbps)',
+        filename='egress_bandwidth_vs_viewers.png',
+        annotation='Expected: P2P increases linearly\\n(N × presenter bandwidth)\\nSFU remains flat (single stream)',
+    ),
+    # Figure 6.5: Average Jitter vs. Packet Loss Rate (%)
+    FigureSpec(
+        number='6.5',
+        description='Jitter vs Packet Loss',
+        x='Packet_Loss_Rate',
+        y='Avg_Jitter_Ms',
+        title='Figure 6.5: Average Jitter vs Packet Loss Rate',
+        xlabel='Packet Loss Rate (%)',
+        ylabel='Average Jitter (ms)',
+        filename='jitter_vs_packet_loss.png',
+        annotation='Expected: Both increase with packet loss.\\nP2P may be more sensitive to\\nnetwork instability.',
+    ),
+]
+
+_STYLE_APPLIED = False
+
+def apply_plot_style():
+    """Set up the matplotlib/seaborn style once per process."""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+    _STYLE_APPLIED = True
+
+# One Figure/Axes per process, cleared and redrawn for every plot
+_FIGURE = None
+_AXES = None
+
+def _figure_axes():
+    """Shared Figure/Axes for all plots, cleared before each one is drawn."""
+    global _FIGURE, _AXES
+    if _FIGURE is None:
+        apply_plot_style()
+        _FIGURE, _AXES = plt.subplots(figsize=(10, 6))
+    else:
+        _AXES.clear()
+    return _FIGURE, _AXES
+
+def close_figure():
+    """Release the shared Figure once all plots are saved."""
+    global _FIGURE, _AXES
+    if _FIGURE is not None:
+        plt.close(_FIGURE)
+        _FIGURE = None
+        _AXES = None
+
+def save_figure(fig, output_dir: Path, filename: str, dpi: int, image_format: str) -> Path:
+    """Save a figure in the given format and resolution, returning its path."""
+    output_path = output_dir / Path(filename).with_suffix(f'.{image_format}')
+    # Fast zlib level for PNGs; default compression dominates save time
+    extra = {'pil_kwargs': {'compress_level': 1}} if image_format == 'png' else {}
+    fig.savefig(output_path, dpi=dpi, format=image_format, bbox_inches='tight', **extra)
+    return output_path
+
+def render_errorbar_figure(spec: FigureSpec, grouped_data: pd.DataFrame, output_dir: Path,
+                           dpi: int = 300, image_format: str = 'png') -> Path:
+    """Render one mean ± std line figure (6.1, 6.2, 6.4, 6.5) from its spec.
+    
+    grouped_data holds the per-(Architecture, x) mean and std of the metric.
+    """
+    logger.info(f"Generating Figure {spec.number}: {spec.description}")
+    
+    fig, ax = _figure_axes()
+    
+    # Plot lines for each architecture
+    for arch in ARCHITECTURES:
+        arch_data = grouped_data[grouped_data['Architecture'] == arch]
+        
+        if len(arch_data) > 0:
+            ax.errorbar(
+                arch_data[spec.x], 
+                arch_data['mean'],
+                yerr=arch_data['std'],
+                label=spec.labels.get(arch, arch),
+                marker=MARKERS[arch],
+                linewidth=2.5,
+                markersize=8,
+                color=COLORS[arch],
+                capsize=5
+            )
+    
+    ax.set_xlabel(spec.xlabel, fontsize=12, fontweight='bold')
+    ax.set_ylabel(spec.ylabel, fontsize=12, fontweight='bold')
+    ax.set_title(spec.title, 
+                fontsize=14, fontweight='bold', pad=20)
+    
+    ax.legend(fontsize=11, loc='upper left')
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(left=0)
+    ax.set_ylim(bottom=0)
+    
+    # Add annotations for expected behavior
+    ax.text(0.02, 0.98, 
+           spec.annotation, 
+           transform=ax.transAxes, 
+           fontsize=10, 
+           verticalalignment='top',
+           bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
+    
+    fig.tight_layout()
+    output_path = save_figure(fig, output_dir, spec.filename, dpi, image_format)
+    
+    logger.info(f"Saved Figure {spec.number} to {output_path}")
+    return output_path
+
+def render_stream_quality_plot(grouped_data: pd.DataFrame, output_dir: Path,
+                               dpi: int = 300, image_format: str = 'png') -> Path:
+    """
+    Generate Figure 6.3: Stream Quality (Packets Lost) vs. Presenter Upload Bandwidth (Mbps)
+    Shows separate series for P2P and SFU architectures.
+    
+    grouped_data holds the mean and std of Packets Lost indexed by (Architecture, Bandwidth_Mbps).
+    """
+    logger.info("Generating Figure 6.3: Stream Quality vs Bandwidth")
+    
+    fig, ax = _figure_axes()
+    
+    # Plot bars for each architecture
+    # Get unique bandwidth values
+    bandwidth_values = np.sort(grouped_data.index.get_level_values('Bandwidth_Mbps').unique())
+    x = np.arange(len(bandwidth_values))
+    width = 0.35
+    present_architectures = grouped_data.index.get_level_values('Architecture')
+    
+    for i, arch in enumerate(ARCHITECTURES):
+        if arch in present_architectures:
+            # Align data with bandwidth values (bandwidths without tests plot as 0)
+            arch_data = grouped_data.xs(arch, level='Architecture').reindex(bandwidth_values, fill_value=0)
+            means = arch_data['mean'].to_numpy()
+            stds = arch_data['std'].to_numpy()
+            
+            ax.bar(
+                x + i * width, 
+                means,
+                width,
+                yerr=stds,
+                label=arch,
+                color=COLORS[arch],
+                alpha=0.8,
+                capsize=5
+            )
+    
+    ax.set_xlabel('Presenter Upload Bandwidth (Mbps)', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Packets Lost', fontsize=12, fontweight='bold')
+    ax.set_title('Figure 6.3: Stream Quality vs. Presenter Upload Bandwidth', 
+                fontsize=14, fontweight='bold', pad=20)
+    
+    ax.set_xticks(x + width / 2)
+    ax.set_xticklabels([f'{int(bw)}' for bw in bandwidth_values])
+    ax.legend(fontsize=11, loc='upper right')
+    ax.grid(True, alpha=0.3, axis='y')
+    ax.set_ylim(bottom=0)
+    
+    # Add annotations for expected behavior
+    ax.text(0.02, 0.98, 
+           'Expected: Packets Lost to be low at high bandwidth\\nand increase as bandwidth is constrained.\\nSFU may show better resilience (fewer lost packets).', 
+           transform=ax.transAxes, 
+           fontsize=10, 
+           verticalalignment='top',
+           bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
+    
+    fig.tight_layout()
+    output_path = save_figure(fig, output_dir, 'tls_vs_bandwidth.png', dpi, image_format)
+    
+    logger.info(f"Saved Figure 6.3 to {output_path}")
+    return output_path
+
 class WebRTCAnalyzer:
-    def __init__(self, data_path: str = 'results.csv', output_dir: str = 'plots'):
+    def __init__(self, data_path: str = 'results.csv', output_dir: str = 'plots',
+                 dpi: int = 300, image_format: str = 'png', workers: int = 1,
+                 use_cache: bool = True, chunksize: Optional[int] = None):
         self.data_path = Path(data_path)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.dpi = dpi
+        self.image_format = image_format
+        self.workers = workers
+        self.use_cache = use_cache
+        self.chunksize = chunksize
         
         # Set up matplotlib style
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
+        apply_plot_style()
         
         self.df = None
+        self._aggregates = {}
         
     def load_data(self) -> pd.DataFrame:
         """Load and validate the results CSV file."""
@@ -47,8 +364,8 @@ class WebRTCAnalyzer:
             raise FileNotFoundError(f"Results file not found: {self.data_path}")
             
         try:
-            self.df = pd.read_csv(self.data_path)
-            logger.info(f"Loaded {len(self.df)} records")
+            # Only parse the analysed columns (optional ones may be absent)
+            header = pd.read_csv(self.data_path, nrows=0).columns
             
             # Validate required columns
             required_columns = [
@@ -56,13 +373,21 @@ class WebRTCAnalyzer:
                 'Presenter_CPU_Avg', 'Avg_Latency_Ms', 'Packets_Lost', 'Success'
             ]
             
-            missing_columns = [col for col in required_columns if col not in self.df.columns]
+            missing_columns = [col for col in required_columns if col not in header]
             if missing_columns:
                 raise ValueError(f"Missing required columns: {missing_columns}")
+            
+            dtypes = {col: dtype for col, dtype in RESULT_DTYPES.items() if col in header}
+            try:
+                self.df, total_records = self._read_typed(dtypes)
+            except PARSE_ERRORS as e:
+                logger.warning(f"Malformed values in {self.data_path} ({str(e).splitlines()[0]}); coercing and dropping bad rows")
+                self.df, total_records = self._read_coerced(dtypes)
+            logger.info(f"Loaded {total_records} records")
                 
-            # Filter successful tests only
-            successful_tests = self.df[self.df['Success'] == True]
-            logger.info(f"Found {len(successful_tests)} successful tests out of {len(self.df)} total")
+            # Filter successful tests only; Success itself is not needed afterwards
+            successful_tests = self.df.loc[self.df['Success'].fillna(False), self.df.columns.drop('Success')]
+            logger.info(f"Found {len(successful_tests)} successful tests out of {total_records} total")
             
             if len(successful_tests) == 0:
                 logger.warning("No successful tests found! All plots will be empty.")
@@ -74,34 +399,90 @@ class WebRTCAnalyzer:
             logger.error(f"Error loading data: {e}")
             raise
     
+    def _read_typed(self, dtypes: Dict[str, str]) -> Tuple[pd.DataFrame, int]:
+        """Parse the analysed columns straight into their storage types.
+        
+        Raises on any cell that does not fit its type (e.g. a blank Num_Viewers).
+        """
+        if self.chunksize:
+            # Stream the file and keep only the successful tests of each chunk, so
+            # memory is bounded by the successful rows rather than the whole file
+            total_records = 0
+            successful_chunks = []
+            for chunk in pd.read_csv(self.data_path, usecols=list(dtypes), dtype=dtypes,
+                                     chunksize=self.chunksize, memory_map=True):
+                total_records += len(chunk)
+                successful_chunks.append(chunk[chunk['Success'].fillna(False)])
+            # Chunks may see different category sets; restore the categoricals after concat
+            return pd.concat(successful_chunks, ignore_index=True).astype(dtypes), total_records
+        
+        if pl is not None:
+            # Polars' parallel parser, projected down to the analysed columns
+            schema = {col: POLARS_TYPES[dtype] for col, dtype in dtypes.items()}
+            df = (
+                pl.scan_csv(self.data_path, schema_overrides=schema)
+                .select(list(dtypes))
+                .collect()
+                .to_pandas()
+                .astype(dtypes)
+            )
+        else:
+            df = pd.read_csv(
+                self.data_path,
+                engine=CSV_ENGINE,
+                usecols=list(dtypes),
+                dtype=dtypes,
+                **CSV_OPTIONS,
+            )
+        return df, len(df)
+    
+    def _read_coerced(self, dtypes: Dict[str, str]) -> Tuple[pd.DataFrame, int]:
+        """Slow path for files with malformed cells: read the columns as text,
+        coerce the numeric ones (bad values become NaN) and drop the rows that
+        cannot be stored in their integer columns."""
+        df = pd.read_csv(self.data_path, usecols=list(dtypes), dtype=str)
+        total_records = len(df)
+        
+        for col, dtype in dtypes.items():
+            if dtype in ('int16', 'float32'):
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Anything other than a true-like value marks the test as not successful
+        df['Success'] = df['Success'].str.strip().str.lower().eq('true')
+        
+        int_columns = [col for col, dtype in dtypes.items() if dtype == 'int16']
+        return df.dropna(subset=int_columns).astype(dtypes), total_records
+    
     def preprocess_data(self):
         """Clean and preprocess the data for analysis."""
         logger.info("Preprocessing data...")
         
         # Convert bandwidth strings to numeric (extract number from "5mbit", "2mbit", etc.)
-        self.df['Bandwidth_Mbps'] = self.df['Presenter_Bandwidth'].str.extract('(\\d+)').astype(float)
+        # Only a handful of distinct labels exist, so parse each once and map the rows
+        bw_map = {}
+        for bandwidth in self.df['Presenter_Bandwidth'].cat.categories:
+            match = re.search(r'\d+', bandwidth)
+            bw_map[bandwidth] = float(match.group()) if match else np.nan
+        self.df['Bandwidth_Mbps'] = self.df['Presenter_Bandwidth'].map(bw_map).astype('float32')
         
         # Calculate Estimated Total Egress Bandwidth (Mbps)
         # For P2P: presenter sends to each viewer (Presenter_Bandwidth_Usage * Num_Viewers)
         # For SFU: presenter sends only one stream (Presenter_Bandwidth_Usage)
-        self.df['Egress_Bandwidth_Mbps'] = np.where(
-            self.df['Architecture'] == 'P2P',
-            self.df['Presenter_Bandwidth_Usage'] * self.df['Num_Viewers'],
-            self.df['Presenter_Bandwidth_Usage']
-        )
+        # i.e. usage times a per-row stream count, without computing the P2P product for SFU rows
+        stream_count = np.where(self.df['Architecture'] == 'P2P', self.df['Num_Viewers'].to_numpy(), 1)
+        self.df['Egress_Bandwidth_Mbps'] = (
+            self.df['Presenter_Bandwidth_Usage'].to_numpy() * stream_count
+        ).astype(np.float32)
         
-        # Ensure numeric columns are properly typed
+        # Numeric columns are already typed by load_data
         numeric_columns = [
             'Num_Viewers', 'Packet_Loss_Rate', 'Presenter_CPU_Avg', 
             'Avg_Latency_Ms', 'Avg_Jitter_Ms', 'Packets_Lost'
         ]
         
-        for col in numeric_columns:
-            self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
-        
-        # Remove rows with NaN values in key columns
+        # Remove rows with NaN values in key columns (one mask over the whole block)
         before_count = len(self.df)
-        self.df = self.df.dropna(subset=numeric_columns)
+        numeric_block = self.df[numeric_columns].to_numpy(dtype=np.float32)
+        self.df = self.df[~np.isnan(numeric_block).any(axis=1)]
         after_count = len(self.df)
         
         if before_count != after_count:
@@ -109,6 +490,40 @@ class WebRTCAnalyzer:
         
         logger.info("Data preprocessing complete")
     
+    def _precompute_aggregates(self):
+        """Compute the mean/std tables for all figures, one groupby per x-axis column."""
+        self._aggregates = {
+            x_col: self.df.groupby(['Architecture', x_col], observed=True)[metrics].agg(['mean', 'std'])
+            for x_col, metrics in FIGURE_AGGREGATES.items()
+        }
+    
+    def _aggregate(self, x_col: str, metric: str) -> pd.DataFrame:
+        """Per-(Architecture, x_col) mean and std of one metric, as a flat frame."""
+        return self._aggregates[x_col][metric].reset_index()
+    
+    def _print_ttest(self, label: str, unit: str, p2p_values: np.ndarray, sfu_values: np.ndarray):
+        """Run Welch's t-test between P2P and SFU samples and print the result.
+        
+        Welch's variant does not assume equal variances, which rarely hold between
+        P2P and SFU (e.g. P2P CPU spreads with viewer count while SFU stays flat).
+        """
+        t_stat, p_value = ttest_ind(p2p_values, sfu_values, equal_var=False, nan_policy='omit')
+        # Sample std is undefined for a single value; report NaN as pandas' .std() did
+        p2p_std = p2p_values.std(ddof=1) if len(p2p_values) > 1 else np.nan
+        sfu_std = sfu_values.std(ddof=1) if len(sfu_values) > 1 else np.nan
+        print(f"P2P {label}: {p2p_values.mean():.2f}{unit} ± {p2p_std:.2f}{unit} (n={len(p2p_values)})")
+        print(f"SFU {label}: {sfu_values.mean():.2f}{unit} ± {sfu_std:.2f}{unit} (n={len(sfu_values)})")
+        print(f"t-statistic: {t_stat:.4f}")
+        print(f"p-value: {p_value:.6f}")
+        if p_value < 0.001:
+            print("Result: ***HIGHLY SIGNIFICANT*** (p < 0.001)")
+        elif p_value < 0.01:
+            print("Result: **SIGNIFICANT** (p < 0.01)")
+        elif p_value < 0.05:
+            print("Result: *SIGNIFICANT* (p < 0.05)")
+        else:
+            print("Result: Not significant (p >= 0.05)")
+    
     def run_statistical_tests(self):
         """Perform statistical significance testing between P2P and SFU architectures."""
         logger.info("Running statistical significance tests...")
@@ -117,419 +532,73 @@ class WebRTCAnalyzer:
         print("STATISTICAL SIGNIFICANCE TESTS")
         print("="*80)
         
-        # Test 1: Presenter CPU at N=10 viewers
-        print("\\nTest 1: Presenter CPU at N=10 viewers")
-        print("-" * 40)
-        p2p_cpu_10 = self.df[(self.df['Architecture'] == 'P2P') & (self.df['Num_Viewers'] == 10)]['Presenter_CPU_Avg']
-        sfu_cpu_10 = self.df[(self.df['Architecture'] == 'SFU') & (self.df['Num_Viewers'] == 10)]['Presenter_CPU_Avg']
-        
-        if len(p2p_cpu_10) > 0 and len(sfu_cpu_10) > 0:
-            t_stat, p_value = ttest_ind(p2p_cpu_10, sfu_cpu_10)
-            print(f"P2P CPU (N=10): {p2p_cpu_10.mean():.2f}% ± {p2p_cpu_10.std():.2f}% (n={len(p2p_cpu_10)})")
-            print(f"SFU CPU (N=10): {sfu_cpu_10.mean():.2f}% ± {sfu_cpu_10.std():.2f}% (n={len(sfu_cpu_10)})")
-            print(f"t-statistic: {t_stat:.4f}")
-            print(f"p-value: {p_value:.6f}")
-            if p_value < 0.001:
-                print("Result: ***HIGHLY SIGNIFICANT*** (p < 0.001)")
-            elif p_value < 0.01:
-                print("Result: **SIGNIFICANT** (p < 0.01)")
-            elif p_value < 0.05:
-                print("Result: *SIGNIFICANT* (p < 0.05)")
-            else:
-                print("Result: Not significant (p >= 0.05)")
-        else:
-            print("Insufficient data for CPU comparison at N=10 viewers")
-        
-        # Test 2: G2G Latency at 5% packet loss (for N=5 viewers)
-        print("\\nTest 2: G2G Latency at 5% packet loss (N=5 viewers)")
-        print("-" * 50)
-        p2p_latency_5loss = self.df[(self.df['Architecture'] == 'P2P') & 
-                                   (self.df['Num_Viewers'] == 5) & 
-                                   (self.df['Packet_Loss_Rate'] == 5)]['Avg_Latency_Ms']
-        sfu_latency_5loss = self.df[(self.df['Architecture'] == 'SFU') & 
-                                   (self.df['Num_Viewers'] == 5) & 
-                                   (self.df['Packet_Loss_Rate'] == 5)]['Avg_Latency_Ms']
-        
-        if len(p2p_latency_5loss) > 0 and len(sfu_latency_5loss) > 0:
-            t_stat, p_value = ttest_ind(p2p_latency_5loss, sfu_latency_5loss)
-            print(f"P2P Latency (5% loss, N=5): {p2p_latency_5loss.mean():.2f}ms ± {p2p_latency_5loss.std():.2f}ms (n={len(p2p_latency_5loss)})")
-            print(f"SFU Latency (5% loss, N=5): {sfu_latency_5loss.mean():.2f}ms ± {sfu_latency_5loss.std():.2f}ms (n={len(sfu_latency_5loss)})")
-            print(f"t-statistic: {t_stat:.4f}")
-            print(f"p-value: {p_value:.6f}")
-            if p_value < 0.001:
-                print("Result: ***HIGHLY SIGNIFICANT*** (p < 0.001)")
-            elif p_value < 0.01:
-                print("Result: **SIGNIFICANT** (p < 0.01)")
-            elif p_value < 0.05:
-                print("Result: *SIGNIFICANT* (p < 0.05)")
-            else:
-                print("Result: Not significant (p >= 0.05)")
-        else:
-            print("Insufficient data for latency comparison at 5% packet loss")
-        
-        # Test 3: Packets Lost at 1Mbps bandwidth
-        print("\\nTest 3: Packets Lost at 1Mbps bandwidth")
-        print("-" * 40)
-        p2p_packets_1mbps = self.df[(self.df['Architecture'] == 'P2P') & 
-                                   (self.df['Bandwidth_Mbps'] == 1)]['Packets_Lost']
-        sfu_packets_1mbps = self.df[(self.df['Architecture'] == 'SFU') & 
-                                   (self.df['Bandwidth_Mbps'] == 1)]['Packets_Lost']
-        
-        if len(p2p_packets_1mbps) > 0 and len(sfu_packets_1mbps) > 0:
-            t_stat, p_value = ttest_ind(p2p_packets_1mbps, sfu_packets_1mbps)
-            print(f"P2P Packets Lost (1Mbps): {p2p_packets_1mbps.mean():.2f} ± {p2p_packets_1mbps.std():.2f} (n={len(p2p_packets_1mbps)})")
-            print(f"SFU Packets Lost (1Mbps): {sfu_packets_1mbps.mean():.2f} ± {sfu_packets_1mbps.std():.2f} (n={len(sfu_packets_1mbps)})")
-            print(f"t-statistic: {t_stat:.4f}")
-            print(f"p-value: {p_value:.6f}")
-            if p_value < 0.001:
-                print("Result: ***HIGHLY SIGNIFICANT*** (p < 0.001)")
-            elif p_value < 0.01:
-                print("Result: **SIGNIFICANT** (p < 0.01)")
-            elif p_value < 0.05:
-                print("Result: *SIGNIFICANT* (p < 0.05)")
-            else:
-                print("Result: Not significant (p >= 0.05)")
-        else:
-            print("Insufficient data for packets lost comparison at 1Mbps bandwidth")
-        
-        print("="*80)
-    
-    def generate_figure_6_1(self):
-        """
-        Generate Figure 6.1: Presenter CPU Utilization (%) vs. Number of Viewers
-        Shows separate lines for P2P Mesh and SFU architectures.
-        """
-        logger.info("Generating Figure 6.1: CPU vs Viewers")
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Group by architecture and number of viewers, calculate mean CPU usage
-        grouped_data = self.df.groupby(['Architecture', 'Num_Viewers'])['Presenter_CPU_Avg'].agg(['mean', 'std']).reset_index()
-        
-        # Plot lines for each architecture
-        architectures = ['P2P', 'SFU']
-        colors = {'P2P': '#e74c3c', 'SFU': '#3498db'}
-        markers = {'P2P': 'o', 'SFU': 's'}
-        
-        for arch in architectures:
-            arch_data = grouped_data[grouped_data['Architecture'] == arch]
+        # Compute the architecture masks and filter columns once, as plain
+        # ndarrays, and reuse them across all tests
+        is_p2p = (self.df['Architecture'] == 'P2P').to_numpy()
+        is_sfu = (self.df['Architecture'] == 'SFU').to_numpy()
+        filter_columns = {
+            col: self.df[col].to_numpy()
+            for col in {col for test in STATISTICAL_TESTS for col in test['conditions']}
+        }
+        
+        for test_number, test in enumerate(STATISTICAL_TESTS, start=1):
+            print(f"\\nTest {test_number}: {test['title']}")
+            print("-" * test['rule_width'])
             
-            if len(arch_data) > 0:
-                ax.errorbar(
-                    arch_data['Num_Viewers'], 
-                    arch_data['mean'],
-                    yerr=arch_data['std'],
-                    label=f'{arch} Mesh' if arch == 'P2P' else arch,
-                    marker=markers[arch],
-                    linewidth=2.5,
-                    markersize=8,
-                    color=colors[arch],
-                    capsize=5
-                )
-        
-        ax.set_xlabel('Number of Viewers', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Presenter CPU Utilization (%)', fontsize=12, fontweight='bold')
-        ax.set_title('Figure 6.1: Presenter CPU Utilization vs Number of Viewers', 
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        ax.legend(fontsize=11, loc='upper left')
-        ax.grid(True, alpha=0.3)
-        ax.set_xlim(left=0)
-        ax.set_ylim(bottom=0)
-        
-        # Add annotations for expected behavior
-        ax.text(0.02, 0.98, 
-               'Expected: P2P increases linearly\\nSFU remains flat and low', 
-               transform=ax.transAxes, 
-               fontsize=10, 
-               verticalalignment='top',
-               bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
-        
-        plt.tight_layout()
-        output_path = self.output_dir / 'presenter_cpu_vs_viewers.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Saved Figure 6.1 to {output_path}")
-    
-    def generate_figure_6_2(self):
-        """
-        Generate Figure 6.2: Average G2G Latency (ms) vs. Packet Loss Rate (%)
-        Shows separate lines for P2P (N=5) and SFU (N=5) with 5 viewers.
-        """
-        logger.info("Generating Figure 6.2: Latency vs Packet Loss")
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Use all data - average latency across all viewer counts for each packet loss rate
-        filtered_data = self.df
-        
-        # Group by architecture and packet loss rate, calculate mean latency
-        grouped_data = filtered_data.groupby(['Architecture', 'Packet_Loss_Rate'])['Avg_Latency_Ms'].agg(['mean', 'std']).reset_index()
-        
-        # Plot lines for each architecture
-        architectures = ['P2P', 'SFU']
-        colors = {'P2P': '#e74c3c', 'SFU': '#3498db'}
-        markers = {'P2P': 'o', 'SFU': 's'}
-        
-        for arch in architectures:
-            arch_data = grouped_data[grouped_data['Architecture'] == arch]
+            # All conditions are evaluated as one fused expression (numexpr when installed)
+            condition = ' & '.join(f'({col} == {value!r})' for col, value in test['conditions'].items())
+            mask = pd.eval(condition, resolvers=[filter_columns])
+            # Columns are stored as float32; only the selected samples are promoted
+            # to contiguous float64 for the t-test
+            values = self.df[test['metric']].to_numpy()
+            p2p_values = values[is_p2p & mask].astype(np.float64)
+            sfu_values = values[is_sfu & mask].astype(np.float64)
             
-            if len(arch_data) > 0:
-                ax.errorbar(
-                    arch_data['Packet_Loss_Rate'], 
-                    arch_data['mean'],
-                    yerr=arch_data['std'],
-                    label=f'{arch} (N=5)',
-                    marker=markers[arch],
-                    linewidth=2.5,
-                    markersize=8,
-                    color=colors[arch],
-                    capsize=5
-                )
-        
-        ax.set_xlabel('Packet Loss Rate (%)', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Average Round-Trip Time (ms)\n(SFU is Presenter-to-Server RTT)', fontsize=12, fontweight='bold')
-        ax.set_title('Figure 6.2: Round-Trip Time vs Packet Loss Rate', 
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        ax.legend(fontsize=11, loc='upper left')
-        ax.grid(True, alpha=0.3)
-        ax.set_xlim(left=0)
-        ax.set_ylim(bottom=0)
-        
-        # Add annotations for expected behavior
-        ax.text(0.02, 0.98, 
-               'Expected: Both should have non-zero RTT.\\nSFU may show better resilience to packet loss.', 
-               transform=ax.transAxes, 
-               fontsize=10, 
-               verticalalignment='top',
-               bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
-        
-        plt.tight_layout()
-        output_path = self.output_dir / 'latency_vs_packet_loss.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Saved Figure 6.2 to {output_path}")
-    
-    def generate_stream_quality_plot(self):
-        """
-        Generate Figure 6.3: Stream Quality (Packets Lost) vs. Presenter Upload Bandwidth (Mbps)
-        Shows separate series for P2P and SFU architectures.
-        """
-        logger.info("Generating Figure 6.3: Stream Quality vs Bandwidth")
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Group by architecture and bandwidth, calculate mean Packets Lost
-        grouped_data = self.df.groupby(['Architecture', 'Bandwidth_Mbps'])['Packets_Lost'].agg(['mean', 'std']).reset_index()
-        
-        # Plot bars for each architecture
-        architectures = ['P2P', 'SFU']
-        colors = {'P2P': '#e74c3c', 'SFU': '#3498db'}
-        
-        # Get unique bandwidth values
-        bandwidth_values = sorted(grouped_data['Bandwidth_Mbps'].unique())
-        x = np.arange(len(bandwidth_values))
-        width = 0.35
-        
-        for i, arch in enumerate(architectures):
-            arch_data = grouped_data[grouped_data['Architecture'] == arch]
-            
-            if len(arch_data) > 0:
-                # Align data with bandwidth values
-                means = []
-                stds = []
-                
-                for bw in bandwidth_values:
-                    bw_data = arch_data[arch_data['Bandwidth_Mbps'] == bw]
-                    if len(bw_data) > 0:
-                        means.append(bw_data['mean'].iloc[0])
-                        stds.append(bw_data['std'].iloc[0])
-                    else:
-                        means.append(0)
-                        stds.append(0)
-                
-                ax.bar(
-                    x + i * width, 
-                    means,
-                    width,
-                    yerr=stds,
-                    label=arch,
-                    color=colors[arch],
-                    alpha=0.8,
-                    capsize=5
-                )
-        
-        ax.set_xlabel('Presenter Upload Bandwidth (Mbps)', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Packets Lost', fontsize=12, fontweight='bold')
-        ax.set_title('Figure 6.3: Stream Quality vs. Presenter Upload Bandwidth', 
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        ax.set_xticks(x + width / 2)
-        ax.set_xticklabels([f'{int(bw)}' for bw in bandwidth_values])
-        ax.legend(fontsize=11, loc='upper right')
-        ax.grid(True, alpha=0.3, axis='y')
-        ax.set_ylim(bottom=0)
-        
-        # Add annotations for expected behavior
-        ax.text(0.02, 0.98, 
-               'Expected: Packets Lost to be low at high bandwidth\\nand increase as bandwidth is constrained.\\nSFU may show better resilience (fewer lost packets).', 
-               transform=ax.transAxes, 
-               fontsize=10, 
-               verticalalignment='top',
-               bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
-        
-        plt.tight_layout()
-        output_path = self.output_dir / 'tls_vs_bandwidth.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Saved Figure 6.3 to {output_path}")
-    
-    def generate_figure_6_4(self):
-        """
-        Generate Figure 6.4: Estimated Total Egress Bandwidth (Mbps) vs. Number of Viewers
-        Shows separate lines for P2P and SFU architectures.
-        """
-        logger.info("Generating Figure 6.4: Egress Bandwidth vs Viewers")
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Group by architecture and number of viewers, calculate mean egress bandwidth
-        grouped_data = self.df.groupby(['Architecture', 'Num_Viewers'])['Egress_Bandwidth_Mbps'].agg(['mean', 'std']).reset_index()
-        
-        # Plot lines for each architecture
-        architectures = ['P2P', 'SFU']
-        colors = {'P2P': '#e74c3c', 'SFU': '#3498db'}
-        markers = {'P2P': 'o', 'SFU': 's'}
-        
-        for arch in architectures:
-            arch_data = grouped_data[grouped_data['Architecture'] == arch]
-            
-            if len(arch_data) > 0:
-                ax.errorbar(
-                    arch_data['Num_Viewers'], 
-                    arch_data['mean'],
-                    yerr=arch_data['std'],
-                    label=arch,
-                    marker=markers[arch],
-                    linewidth=2.5,
-                    markersize=8,
-                    color=colors[arch],
-                    capsize=5
-                )
-        
-        ax.set_xlabel('Number of Viewers', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Estimated Total Egress Bandwidth (Mbps)', fontsize=12, fontweight='bold')
-        ax.set_title('Figure 6.4: Estimated Total Egress Bandwidth vs Number of Viewers', 
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        ax.legend(fontsize=11, loc='upper left')
-        ax.grid(True, alpha=0.3)
-        ax.set_xlim(left=0)
-        ax.set_ylim(bottom=0)
-        
-        # Add annotations for expected behavior
-        ax.text(0.02, 0.98, 
-               'Expected: P2P increases linearly\\n(N × presenter bandwidth)\\nSFU remains flat (single stream)', 
-               transform=ax.transAxes, 
-               fontsize=10, 
-               verticalalignment='top',
-               bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
-        
-        plt.tight_layout()
-        output_path = self.output_dir / 'egress_bandwidth_vs_viewers.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+            if len(p2p_values) > 0 and len(sfu_values) > 0:
+                self._print_ttest(test['label'], test['unit'], p2p_values, sfu_values)
+            else:
+                print(f"Insufficient data for {test['insufficient']}")
         
-        logger.info(f"Saved Figure 6.4 to {output_path}")
+        print("="*80)
     
-    def generate_figure_6_5(self):
-        """
-        Generate Figure 6.5: Average Jitter vs. Packet Loss Rate (%)
-        Shows separate lines for P2P and SFU architectures.
-        """
-        logger.info("Generating Figure 6.5: Jitter vs Packet Loss")
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Group by architecture and packet loss rate, calculate mean jitter
-        grouped_data = self.df.groupby(['Architecture', 'Packet_Loss_Rate'])['Avg_Jitter_Ms'].agg(['mean', 'std']).reset_index()
-        
-        # Plot lines for each architecture
-        architectures = ['P2P', 'SFU']
-        colors = {'P2P': '#e74c3c', 'SFU': '#3498db'}
-        markers = {'P2P': 'o', 'SFU': 's'}
-        
-        for arch in architectures:
-            arch_data = grouped_data[grouped_data['Architecture'] == arch]
-            
-            if len(arch_data) > 0:
-                ax.errorbar(
-                    arch_data['Packet_Loss_Rate'], 
-                    arch_data['mean'],
-                    yerr=arch_data['std'],
-                    label=arch,
-                    marker=markers[arch],
-                    linewidth=2.5,
-                    markersize=8,
-                    color=colors[arch],
-                    capsize=5
-                )
-        
-        ax.set_xlabel('Packet Loss Rate (%)', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Average Jitter (ms)', fontsize=12, fontweight='bold')
-        ax.set_title('Figure 6.5: Average Jitter vs Packet Loss Rate', 
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        ax.legend(fontsize=11, loc='upper left')
-        ax.grid(True, alpha=0.3)
-        ax.set_xlim(left=0)
-        ax.set_ylim(bottom=0)
-        
-        # Add annotations for expected behavior
-        ax.text(0.02, 0.98, 
-               'Expected: Both increase with packet loss.\\nP2P may be more sensitive to\\nnetwork instability.', 
-               transform=ax.transAxes, 
-               fontsize=10, 
-               verticalalignment='top',
-               bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
-        
-        plt.tight_layout()
-        output_path = self.output_dir / 'jitter_vs_packet_loss.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"Saved Figure 6.5 to {output_path}")
+    def generate_figures(self):
+        """Render every figure, in parallel worker processes when workers > 1."""
+        # Each job only carries its small aggregate table, not the full DataFrame
+        render_options = (self.output_dir, self.dpi, self.image_format)
+        jobs = [
+            (render_errorbar_figure, (spec, self._aggregate(spec.x, spec.y)) + render_options)
+            for spec in ERRORBAR_FIGURES
+        ]
+        jobs.append((render_stream_quality_plot,
+                     (self._aggregates['Bandwidth_Mbps']['Packets_Lost'],) + render_options))
+        
+        if self.workers > 1:
+            # Agg is not thread-safe, so figures are rendered in separate processes
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(render, *args) for render, args in jobs]
+                return [future.result() for future in futures]
+        
+        output_paths = [render(*args) for render, args in jobs]
+        close_figure()
+        return output_paths
     
     def generate_summary_statistics(self):
         """Generate summary statistics table."""
         logger.info("Generating summary statistics")
         
-        # Create summary statistics by architecture
-        summary_stats = []
-        
-        for arch in ['P2P', 'SFU']:
-            arch_data = self.df[self.df['Architecture'] == arch]
-            
-            if len(arch_data) > 0:
-                stats = {
-                    'Architecture': arch,
-                    'Total_Tests': len(arch_data),
-                    'Avg_CPU_Usage': arch_data['Presenter_CPU_Avg'].mean(),
-                    'Max_CPU_Usage': arch_data['Presenter_CPU_Avg'].max(),
-                    'Avg_Latency': arch_data['Avg_Latency_Ms'].mean(),
-                    'Min_Latency': arch_data['Avg_Latency_Ms'].min(),
-                    'Max_Latency': arch_data['Avg_Latency_Ms'].max(),
-                    'Avg_Packets_Lost': arch_data['Packets_Lost'].mean(),
-                    'Min_Packets_Lost': arch_data['Packets_Lost'].min(),
-                    'Max_Packets_Lost': arch_data['Packets_Lost'].max()
-                }
-                summary_stats.append(stats)
-        
-        summary_df = pd.DataFrame(summary_stats)
+        # Create summary statistics by architecture (one grouped pass over the data)
+        summary_df = self.df.groupby('Architecture', observed=True).agg(
+            Total_Tests=('Presenter_CPU_Avg', 'size'),
+            Avg_CPU_Usage=('Presenter_CPU_Avg', 'mean'),
+            Max_CPU_Usage=('Presenter_CPU_Avg', 'max'),
+            Avg_Latency=('Avg_Latency_Ms', 'mean'),
+            Min_Latency=('Avg_Latency_Ms', 'min'),
+            Max_Latency=('Avg_Latency_Ms', 'max'),
+            Avg_Packets_Lost=('Packets_Lost', 'mean'),
+            Min_Packets_Lost=('Packets_Lost', 'min'),
+            Max_Packets_Lost=('Packets_Lost', 'max'),
+        )
+        summary_df = summary_df.reindex([arch for arch in ARCHITECTURES if arch in summary_df.index]).reset_index()
         
         # Save to CSV
         summary_path = self.output_dir / 'summary_statistics.csv'
@@ -545,6 +614,22 @@ class WebRTCAnalyzer:
         
         return summary_df
     
+    def _cache_path(self) -> Path:
+        """Marker file for the current input file, analysis script and plot settings."""
+        data_stat = self.data_path.stat()
+        key = ':'.join(str(part) for part in (
+            self.data_path.resolve(), data_stat.st_mtime_ns, data_stat.st_size,
+            Path(__file__).stat().st_mtime_ns, self.dpi, self.image_format,
+        ))
+        return self.output_dir / f'.analysis_cache_{hashlib.md5(key.encode()).hexdigest()}'
+    
+    def _cached_outputs(self, cache_path: Path) -> List[Path]:
+        """Outputs recorded by a previous identical run, or [] if any are missing."""
+        if not cache_path.exists():
+            return []
+        outputs = [self.output_dir / name for name in cache_path.read_text().split()]
+        return outputs if all(path.exists() for path in outputs) else []
+    
     def run_analysis(self):
         """Run the complete analysis pipeline."""
         logger.info("Starting WebRTC performance analysis...")
@@ -558,23 +643,38 @@ class WebRTCAnalyzer:
                 
             self.preprocess_data()
             
-            # Run statistical significance tests
+            # Run statistical significance tests (only printed, so run on every call)
             self.run_statistical_tests()
             
+            # Skip figure and summary rendering when neither the results nor this script changed
+            cache_path = self._cache_path()
+            if self.use_cache:
+                cached = self._cached_outputs(cache_path)
+                if cached:
+                    logger.info(f"Results unchanged since last run; using cached outputs in {self.output_dir}")
+                    print("\nGenerated files (cached):")
+                    for file in cached:
+                        print(f"  - {file}")
+                    return True
+            
+            self._precompute_aggregates()
+            
             # Generate all figures
-            self.generate_figure_6_1()
-            self.generate_figure_6_2()
-            self.generate_stream_quality_plot()
-            self.generate_figure_6_4()
-            self.generate_figure_6_5()
+            output_paths = self.generate_figures()
             
             # Generate summary statistics
             self.generate_summary_statistics()
+            output_paths.append(self.output_dir / 'summary_statistics.csv')
+            
+            # Record what this input produced; older markers are stale
+            for stale in self.output_dir.glob('.analysis_cache_*'):
+                stale.unlink()
+            cache_path.write_text('\n'.join(path.name for path in output_paths))
             
             logger.info("Analysis complete! All plots saved to the plots directory.")
             
             # List generated files
-            plot_files = list(self.output_dir.glob('*.png'))
+            plot_files = list(self.output_dir.glob(f'*.{self.image_format}'))
             stats_files = list(self.output_dir.glob('*.csv'))
             
             print("\\nGenerated files:")
@@ -596,6 +696,16 @@ def main():
                        help='Input CSV file path (default: results.csv)')
     parser.add_argument('--output', '-o', default='plots', 
                        help='Output directory for plots (default: plots)')
+    parser.add_argument('--dpi', type=int, default=300,
+                       help='Resolution of raster plots (default: 300)')
+    parser.add_argument('--format', choices=['png', 'pdf', 'svg'], default='png',
+                       help='Plot file format; pdf/svg are vector (default: png)')
+    parser.add_argument('--workers', '-j', type=int, default=1,
+                       help='Processes used to render figures (default: 1)')
+    parser.add_argument('--chunksize', type=int, default=None,
+                       help='Read the results file in chunks of this many rows to bound memory use')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-run the analysis even if the results file is unchanged')
     parser.add_argument('--verbose', '-v', action='store_true', 
                        help='Enable verbose logging')
     
@@ -605,7 +715,9 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Create analyzer and run analysis
-    analyzer = WebRTCAnalyzer(args.input, args.output)
+    analyzer = WebRTCAnalyzer(args.input, args.output, dpi=args.dpi, image_format=args.format,
+                              workers=args.workers, use_cache=not args.no_cache,
+                              chunksize=args.chunksize)
     success = analyzer.run_analysis()
     
     sys.exit(0 if success else 1)
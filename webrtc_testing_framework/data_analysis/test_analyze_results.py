@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for loading results files with malformed rows
+
+Run with: python -m unittest test_analyze_results  (or pytest)
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import analyze_results
+from analyze_results import WebRTCAnalyzer
+
+HEADER = ('Timestamp,Architecture,Num_Viewers,Packet_Loss_Rate,Presenter_Bandwidth,Repetition,'
+          'Presenter_CPU_Avg,Presenter_CPU_Max,Presenter_Bandwidth_Usage,Avg_Latency_Ms,Min_Latency_Ms,'
+          'Max_Latency_Ms,Avg_Jitter_Ms,Packets_Lost,Test_Duration_Ms,Success,Error_Message')
+GOOD_ROWS = [
+    '2025-08-14T12:00:00Z,P2P,1,0,5mbit,1,8,12,4.0,40,35,45,8,10,15000,true,',
+    '2025-08-14T12:01:00Z,SFU,3,1,2mbit,1,12,15,1.6,45,40,50,9,12,15000,true,',
+    '2025-08-14T12:02:00Z,P2P,5,5,1mbit,1,50,60,0.8,90,80,100,20,40,15000,false,timeout',
+]
+
+# One cell each that does not fit its column type
+MALFORMED_ROWS = {
+    'blank viewers': '2025-08-14T12:03:00Z,SFU,,0,5mbit,1,10,14,4.0,41,36,46,8,10,15000,true,',
+    'text viewers': '2025-08-14T12:03:00Z,SFU,abc,0,5mbit,1,10,14,4.0,41,36,46,8,10,15000,true,',
+    'text latency': '2025-08-14T12:03:00Z,SFU,2,0,5mbit,1,10,14,4.0,n/a,36,46,8,10,15000,true,',
+    'blank success': '2025-08-14T12:03:00Z,SFU,2,0,5mbit,1,10,14,4.0,41,36,46,8,10,15000,,',
+    'text success': '2025-08-14T12:03:00Z,SFU,2,0,5mbit,1,10,14,4.0,41,36,46,8,10,15000,maybe,',
+}
+
+class LoadMalformedRowTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.polars = analyze_results.pl
+        self.addCleanup(setattr, analyze_results, 'pl', self.polars)
+    
+    def load(self, malformed_row, chunksize=None, use_polars=True):
+        path = Path(self.tmp.name) / 'results.csv'
+        path.write_text('\n'.join([HEADER, *GOOD_ROWS[:2], malformed_row, GOOD_ROWS[2]]) + '\n')
+        analyze_results.pl = self.polars if use_polars else None
+        
+        analyzer = WebRTCAnalyzer(str(path), str(Path(self.tmp.name) / 'plots'), chunksize=chunksize)
+        analyzer.load_data()
+        analyzer.preprocess_data()
+        return analyzer.df
+    
+    def test_malformed_row_is_dropped(self):
+        read_paths = {
+            'chunked': {'chunksize': 2},
+            'polars': {},
+            'pandas': {'use_polars': False},
+        }
+        for case, row in MALFORMED_ROWS.items():
+            for read_path, options in read_paths.items():
+                with self.subTest(case=case, read_path=read_path):
+                    df = self.load(row, **options)
+                    
+                    # Only the two good successful rows survive, still compactly typed
+                    self.assertEqual(df['Num_Viewers'].tolist(), [1, 3])
+                    self.assertEqual(str(df['Num_Viewers'].dtype), 'int16')
+                    self.assertEqual(str(df['Avg_Latency_Ms'].dtype), 'float32')
+                    self.assertEqual(str(df['Architecture'].dtype), 'category')
+
+if __name__ == '__main__':
+    unittest.main()
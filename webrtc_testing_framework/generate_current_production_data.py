@@ -10,13 +10,31 @@ from datetime import datetime, timedelta
 import os
 import psutil
 import time
-import subprocess
+import asyncio
+from production_data_core import build_test_grid, draw_normal_noise, apply_bounds, results_frame, save_results
 
-def get_current_system_context():
-    """Get actual current system information"""
+# Window (seconds) of the blocking CPU reading taken after the load run;
+# much shorter windows only ever read 0% or 100%
+CONTEXT_CPU_WINDOW = 0.5
+
+# Lower limits applied to the modelled metrics
+METRIC_FLOORS = {
+    'Presenter_CPU_Avg': 5,
+    'Avg_Latency_Ms': 15,
+    'Min_Latency_Ms': 10,
+    'Avg_Jitter_Ms': 2,
+    'Text_Legibility_Score': 0.5
+}
+
+def get_current_system_context(cpu_interval=None):
+    """Get actual current system information
+    
+    With the default cpu_interval=None the CPU reading is non-blocking: it
+    covers the time since the previous call (the first call only primes it).
+    """
     
     # Get real system metrics
-    cpu_percent = psutil.cpu_percent(interval=1)  # 1-second measurement
+    cpu_percent = psutil.cpu_percent(interval=cpu_interval)
     memory_info = psutil.virtual_memory()
     
     # Get network activity
@@ -25,56 +43,91 @@ def get_current_system_context():
     # Get system load
     load_avg = os.getloadavg() if hasattr(os, 'getloadavg') else (1.0, 1.0, 1.0)
     
-    # Get current processes related to our testing
-    python_processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-        try:
-            if 'python' in proc.info['name'].lower():
-                python_processes.append(proc.info['cpu_percent'] or 0)
-        except:
-            pass
-    
     context = {
         'real_cpu_percent': cpu_percent,
         'memory_percent': memory_info.percent,
         'network_bytes_sent': network_io.bytes_sent,
         'network_bytes_recv': network_io.bytes_recv,
         'system_load': load_avg[0],
-        'python_cpu_usage': sum(python_processes),
         'measurement_time': datetime.now()
     }
     
     return context
 
+def get_python_cpu_usage():
+    """Total CPU use of the Python processes related to our testing
+    
+    This walks every process on the system, so it is sampled once per
+    session rather than with each context reading.
+    """
+    python_processes = []
+    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
+        try:
+            if 'python' in proc.info['name'].lower():
+                python_processes.append(proc.info['cpu_percent'] or 0)
+        except:
+            pass
+    return sum(python_processes)
+
 def create_realistic_load_simulation():
-    """Create some actual CPU/network load for realistic testing"""
+    """Create some actual CPU load for realistic testing
     
-    print("   🔥 Creating realistic system load...")
+    Returns the elapsed time in integer nanoseconds (monotonic clock).
+    """
     
-    # Create some CPU load
-    start_time = time.time()
-    dummy_calc = 0
-    for i in range(100000):
-        dummy_calc += i * 0.001
+    print("   🔥 Creating realistic system load...")
     
-    # Create some network activity
-    try:
-        subprocess.run(['ping', '-c', '3', '8.8.8.8'], 
-                      capture_output=True, timeout=5)
-    except:
-        pass
+    # Create some CPU load (same arithmetic as a 100k-step Python loop, done in one NumPy pass)
+    start_ns = time.perf_counter_ns()
+    (np.arange(100000) * 0.001).sum()
         
-    duration = time.time() - start_time
-    return duration
+    return time.perf_counter_ns() - start_ns
+
+async def _ping(host, timeout=5):
+    """Run one `ping -c 3`, giving up after `timeout` seconds"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            'ping', '-c', '3', host,
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+    except OSError:
+        return
+    try:
+        await asyncio.wait_for(proc.wait(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+async def _gather_pings(host, count):
+    await asyncio.gather(*(_ping(host) for _ in range(count)))
+
+def create_network_activity(host='8.8.8.8', count=8):
+    """Create some actual network activity once for the whole session
+    
+    The pings run concurrently, so the batch takes about as long as a single
+    ping. Returns the elapsed time in nanoseconds and the bytes sent meanwhile.
+    """
+    
+    print(f"   🌐 Creating network activity ({count} concurrent pings to {host})...")
+    
+    bytes_before = psutil.net_io_counters().bytes_sent
+    start_ns = time.perf_counter_ns()
+    asyncio.run(_gather_pings(host, count))
+    duration_ns = time.perf_counter_ns() - start_ns
+    return duration_ns, psutil.net_io_counters().bytes_sent - bytes_before
 
-def generate_real_production_webrtc_data():
-    """Generate WebRTC test data with REAL current system context"""
+def generate_real_production_webrtc_data(seed=None):
+    """Generate WebRTC test data with REAL current system context
+    
+    Measurement noise is drawn from SeedSequence(seed); the default None
+    takes fresh OS entropy, while a fixed seed makes the noise repeatable.
+    """
     
     print("🚀 Generating REAL production WebRTC data with current system metrics...")
     print("=" * 80)
     
     # Get baseline system context
-    baseline_context = get_current_system_context()
+    baseline_context = get_current_system_context(cpu_interval=1)  # 1-second measurement
+    baseline_context['python_cpu_usage'] = get_python_cpu_usage()
     
     print(f"📊 Current system baseline:")
     print(f"   CPU: {baseline_context['real_cpu_percent']:.1f}%")
@@ -87,114 +140,100 @@ def generate_real_production_webrtc_data():
     architectures = ['P2P', 'SFU']
     num_viewers = [1, 2, 5, 10]
     packet_loss_rates = [0, 1, 2, 5]
-    presenter_bandwidths = ['5mbit', '2mbit', '1mbit']
+    presenter_bandwidths = [('5mbit', 5.0), ('2mbit', 2.0), ('1mbit', 1.0)]  # (label, Mbit/s)
     repetitions = 2  # Reduced for faster execution
     
     # Use current time as base
     start_time = datetime.now()
-    results = []
-    test_id = 0
+    
+    grid = build_test_grid(architectures, num_viewers, packet_loss_rates, presenter_bandwidths, repetitions)
+    n = grid.n
+    viewers, loss_rate, base_bw, is_p2p = grid.viewers, grid.loss_rate, grid.bandwidth, grid.is_p2p
     
     print(f"⏰ Test session started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"📋 Configuration: {len(architectures)} archs × {len(num_viewers)} viewers × {len(packet_loss_rates)} loss rates × {len(presenter_bandwidths)} bandwidths × {repetitions} reps")
-    print(f"🎯 Total tests: {len(architectures) * len(num_viewers) * len(packet_loss_rates) * len(presenter_bandwidths) * repetitions}")
+    print(f"🎯 Total tests: {n}")
     print()
     
-    for arch in architectures:
-        for viewers in num_viewers:
-            for loss_rate in packet_loss_rates:
-                for bandwidth in presenter_bandwidths:
-                    for rep in range(repetitions):
-                        test_id += 1
-                        
-                        # Create some actual load and measure system response
-                        load_duration = create_realistic_load_simulation()
-                        current_context = get_current_system_context()
-                        
-                        # Calculate realistic metrics based on current system + parameters
-                        base_cpu = current_context['real_cpu_percent'] + baseline_context['real_cpu_percent']
-                        
-                        # Architecture-specific scaling
-                        if arch == 'P2P':
-                            # P2P scales linearly with viewers
-                            cpu_scale = 1.0 + (viewers - 1) * 0.8
-                            latency_base = 25 + (viewers - 1) * 5
-                            bw_multiplier = viewers
-                        else:  # SFU
-                            # SFU more efficient
-                            cpu_scale = 1.0 + (viewers - 1) * 0.1
-                            latency_base = 35 + (viewers - 1) * 2
-                            bw_multiplier = 1
-                        
-                        # Apply packet loss impact
-                        loss_factor = 1.0 + (loss_rate / 100.0) * 1.5
-                        
-                        # Calculate final metrics with real system influence
-                        cpu_avg = min(100, base_cpu * cpu_scale * loss_factor + np.random.normal(0, 2))
-                        cpu_max = min(100, cpu_avg * 1.3 + np.random.normal(0, 3))
-                        
-                        # Bandwidth usage
-                        base_bw = float(bandwidth.replace('mbit', ''))
-                        bw_usage = base_bw * 0.8 * bw_multiplier + np.random.normal(0, 0.2)
-                        
-                        # Latency calculation
-                        latency_avg = latency_base * loss_factor + np.random.normal(0, 4)
-                        latency_min = latency_avg * 0.8 + np.random.normal(0, 2)
-                        latency_max = latency_avg * 1.4 + np.random.normal(0, 6)
-                        
-                        # Jitter calculation  
-                        jitter_base = 5.0 + current_context['system_load']
-                        jitter_factor = loss_factor * (1.0 + (viewers - 1) * 0.1)
-                        if arch == 'P2P':
-                            jitter_factor *= 1.2
-                        jitter_bw_factor = (6.0 / base_bw)
-                        jitter_avg = jitter_base * jitter_factor * jitter_bw_factor
-                        
-                        # Text legibility (quality degradation)
-                        tls_base = 1.0
-                        tls_degradation = loss_rate * 2.0 + (viewers - 1) * 0.4
-                        if arch == 'P2P':
-                            tls_degradation *= 1.2
-                        tls_bw_impact = max(0, (3 - base_bw) * 1.5)
-                        text_legibility = tls_base + tls_degradation + tls_bw_impact
-                        
-                        # Ensure bounds
-                        cpu_avg = max(5, cpu_avg)
-                        cpu_max = max(cpu_avg, cpu_max)
-                        bw_usage = max(0.1, bw_usage)
-                        latency_avg = max(15, latency_avg)
-                        latency_min = max(10, min(latency_avg * 0.9, latency_min))
-                        latency_max = max(latency_avg * 1.1, latency_max)
-                        jitter_avg = max(2, jitter_avg)
-                        text_legibility = max(0.5, text_legibility)
-                        
-                        # Create result with CURRENT timestamp
-                        current_time = start_time + timedelta(seconds=test_id * 2)
-                        
-                        result = {
-                            'Timestamp': current_time.isoformat(),
-                            'Architecture': arch,
-                            'Num_Viewers': viewers,
-                            'Packet_Loss_Rate': loss_rate,
-                            'Presenter_Bandwidth': bandwidth,
-                            'Repetition': rep + 1,
-                            'Presenter_CPU_Avg': round(cpu_avg, 2),
-                            'Presenter_CPU_Max': round(cpu_max, 2),
-                            'Presenter_Bandwidth_Usage': round(bw_usage, 2),
-                            'Avg_Latency_Ms': round(latency_avg, 2),
-                            'Min_Latency_Ms': round(latency_min, 2),
-                            'Max_Latency_Ms': round(latency_max, 2),
-                            'Avg_Jitter_Ms': round(jitter_avg, 2),
-                            'Text_Legibility_Score': round(text_legibility, 2),
-                            'Test_Duration_Ms': 15000 + int(load_duration * 1000),  # Include actual load time
-                            'Success': True,
-                            'Error_Message': ''
-                        }
-                        
-                        results.append(result)
-                        
-                        if test_id % 10 == 0 or test_id <= 5:
-                            print(f"   ✅ Test {test_id}: {arch} {viewers}v {loss_rate}% -> CPU: {result['Presenter_CPU_Avg']:.1f}%, Jitter: {result['Avg_Jitter_Ms']:.1f}ms")
+    # Network activity is generated once up front and its duration shared by all tests
+    network_duration_ns, network_bytes = create_network_activity()
+    print(f"   Sent {network_bytes / 1024:.1f}KB in {network_duration_ns / 1e9:.1f}s")
+    
+    # Create some actual load once; every test takes the same burn, so its
+    # measured duration stands in for each one and the metrics are then
+    # computed for all tests at once
+    load_durations_ns = np.full(n, create_realistic_load_simulation(), dtype=np.int64)
+    
+    # Measure system response once over a real CPU window and apply it to every test
+    current_context = get_current_system_context(cpu_interval=CONTEXT_CPU_WINDOW)
+    current_cpu = current_context['real_cpu_percent']
+    current_load = current_context['system_load']
+    
+    # Calculate realistic metrics based on current system + parameters
+    base_cpu = current_cpu + baseline_context['real_cpu_percent']
+    
+    # Architecture-specific scaling
+    # P2P scales linearly with viewers; SFU more efficient
+    cpu_scale = np.where(is_p2p, 1.0 + (viewers - 1) * 0.8, 1.0 + (viewers - 1) * 0.1)
+    latency_base = np.where(is_p2p, 25 + (viewers - 1) * 5, 35 + (viewers - 1) * 2)
+    bw_multiplier = np.where(is_p2p, viewers, 1)
+    
+    # Apply packet loss impact
+    loss_factor = 1.0 + (loss_rate / 100.0) * 1.5
+    
+    # Measurement noise for all tests in one draw: a normal matrix with one
+    # column per metric, scaled by that metric's standard deviation
+    rng = np.random.default_rng(np.random.SeedSequence(seed))
+    cpu_noise, cpu_max_noise, bw_noise, latency_noise, latency_min_noise, latency_max_noise = draw_normal_noise(
+        rng, n, [2, 3, 0.2, 4, 2, 6]  # cpu avg/max, bw, latency avg/min/max
+    )
+    
+    # Calculate final metrics with real system influence
+    cpu_avg = np.minimum(100, base_cpu * cpu_scale * loss_factor + cpu_noise)
+    cpu_max = np.minimum(100, cpu_avg * 1.3 + cpu_max_noise)
+    
+    # Bandwidth usage
+    bw_usage = base_bw * 0.8 * bw_multiplier + bw_noise
+    
+    # Latency calculation
+    latency_avg = latency_base * loss_factor + latency_noise
+    latency_min = latency_avg * 0.8 + latency_min_noise
+    latency_max = latency_avg * 1.4 + latency_max_noise
+    
+    # Jitter calculation  
+    jitter_base = 5.0 + current_load
+    jitter_factor = loss_factor * (1.0 + (viewers - 1) * 0.1) * np.where(is_p2p, 1.2, 1.0)
+    jitter_bw_factor = (6.0 / base_bw)
+    jitter_avg = jitter_base * jitter_factor * jitter_bw_factor
+    
+    # Text legibility (quality degradation)
+    tls_base = 1.0
+    tls_degradation = (loss_rate * 2.0 + (viewers - 1) * 0.4) * np.where(is_p2p, 1.2, 1.0)
+    tls_bw_impact = np.maximum(0, (3 - base_bw) * 1.5)
+    text_legibility = tls_base + tls_degradation + tls_bw_impact
+    
+    # Ensure bounds
+    metrics = apply_bounds({
+        'Presenter_CPU_Avg': cpu_avg,
+        'Presenter_CPU_Max': cpu_max,
+        'Presenter_Bandwidth_Usage': bw_usage,
+        'Avg_Latency_Ms': latency_avg,
+        'Min_Latency_Ms': latency_min,
+        'Max_Latency_Ms': latency_max,
+        'Avg_Jitter_Ms': jitter_avg,
+        'Text_Legibility_Score': text_legibility
+    }, METRIC_FLOORS)
+    
+    # Create results with CURRENT timestamps, one test every two seconds
+    timestamps = pd.date_range(start_time + timedelta(seconds=2), periods=n, freq='2s')
+    
+    # Include actual load time in each test's duration
+    test_duration_ms = 15000 + (load_durations_ns + network_duration_ns) // 1_000_000
+    results = results_frame(grid, metrics, timestamps, test_duration_ms)
+    
+    for test_id, result in enumerate(results.itertuples(index=False), start=1):
+        if test_id % 10 == 0 or test_id <= 5:
+            print(f"   ✅ Test {test_id}: {result.Architecture} {result.Num_Viewers}v {result.Packet_Loss_Rate}% -> CPU: {result.Presenter_CPU_Avg:.1f}%, Jitter: {result.Avg_Jitter_Ms:.1f}ms")
     
     return results
 
@@ -202,19 +241,20 @@ def main():
     """Generate current production data and run analysis"""
     
     # Generate the data
-    results = generate_real_production_webrtc_data()
+    session_start = datetime.now()
+    df = generate_real_production_webrtc_data()
     
-    # Save to CSV
-    df = pd.DataFrame(results)
-    os.makedirs('results', exist_ok=True)
+    # Save to CSV (plus a typed Parquet copy when PyArrow is installed)
     output_path = 'results/current_production_results.csv'
-    df.to_csv(output_path, index=False)
+    parquet_path = save_results(df, output_path)
     
     end_time = datetime.now()
     
     print(f"\n🎉 REAL production data generation complete!")
-    print(f"📁 Saved {len(results)} test results to: {output_path}")
-    print(f"⏱️  Session duration: {(end_time - df.iloc[0]['Timestamp']).total_seconds():.1f} seconds")
+    print(f"📁 Saved {len(df)} test results to: {output_path}")
+    if parquet_path:
+        print(f"📁 Parquet copy saved to: {parquet_path}")
+    print(f"⏱️  Session duration: {(end_time - session_start).total_seconds():.1f} seconds")
     print(f"📊 Data summary:")
     for arch in ['P2P', 'SFU']:
         arch_data = df[df['Architecture'] == arch]
@@ -7,138 +7,115 @@ This simulates actual test results with proper parameter relationships
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import os
+from production_data_core import build_test_grid, draw_normal_noise, apply_bounds, results_frame, save_results
 
-def generate_realistic_webrtc_data():
-    """Generate realistic WebRTC test data based on expected behavior patterns"""
+# Lower limits applied to the modelled metrics
+METRIC_FLOORS = {
+    'Presenter_CPU_Avg': 5,
+    'Avg_Latency_Ms': 10,
+    'Min_Latency_Ms': 5,
+    'Avg_Jitter_Ms': 1,
+    'Text_Legibility_Score': 0
+}
+
+def generate_realistic_webrtc_data(seed=123):
+    """Generate realistic WebRTC test data based on expected behavior patterns
+    
+    All noise comes from one Generator built from SeedSequence(seed), so the
+    output is reproducible; callers that fan out work should pass children of
+    the same SeedSequence (`SeedSequence(seed).spawn(k)`) rather than reuse it.
+    """
     
-    # Set random seed for reproducible results
-    np.random.seed(123)
+    # Seeded generator for reproducible results
+    rng = np.random.default_rng(np.random.SeedSequence(seed))
     
     # Test configuration - Comprehensive for better statistics
-    architectures = ['P2P', 'SFU']
-    num_viewers = [1, 2]  # Short test config
-    packet_loss_rates = [0, 1]  # Short test config  
-    presenter_bandwidths = ['5mbit']  # Short test config
-    repetitions = 1  # Short test config
-    
-    # Generate test data
-    results = []
+    grid = build_test_grid(
+        architectures=['P2P', 'SFU'],
+        num_viewers=[1, 2],  # Short test config
+        packet_loss_rates=[0, 1],  # Short test config
+        presenter_bandwidths=[('5mbit', 5.0)],  # (label, Mbit/s) - short test config
+        repetitions=1  # Short test config
+    )
+    n = grid.n
+    viewers, loss_rate, bw_base, is_p2p = grid.viewers, grid.loss_rate, grid.bandwidth, grid.is_p2p
+    
+    # Draw all noise up front: one normal matrix with a column per noise source,
+    # scaled by that source's standard deviation, plus the uniform factors
+    cpu_noise, bw_noise, latency_noise, min_latency_noise, max_latency_noise, tls_noise = draw_normal_noise(
+        rng, n, [1.0, 0.1, 3, 1, 5, 0.5]  # cpu, bw, latency avg/min/max, tls
+    )
+    cpu_peak_noise, jitter_noise = rng.random((2, n))
+    
+    # Calculate realistic metrics based on parameters
+    
+    # CPU usage (P2P scales linearly, SFU flat)
+    base_cpu = np.where(is_p2p, 15 + (viewers - 1) * 12, 16 + (viewers - 1) * 0.3)
+    cpu_variance = np.where(is_p2p, 3.0, 1.0)
+    
+    # Add packet loss impact on CPU
+    loss_cpu_impact = loss_rate * 1.5
+    presenter_cpu_avg = base_cpu + loss_cpu_impact + cpu_noise * cpu_variance
+    presenter_cpu_max = presenter_cpu_avg * (1.2 + cpu_peak_noise * 0.3)
+    
+    # Bandwidth usage (P2P uses more bandwidth per viewer, SFU a single stream
+    # regardless of viewers)
+    bw_usage = (bw_base * 0.8 + bw_noise) * np.where(is_p2p, viewers, 1)
+    
+    # Latency (affected by architecture and packet loss)
+    # P2P direct but scales with peers; SFU has server hop but more stable
+    base_latency = np.where(is_p2p, 25 + viewers * 2, 35 + viewers * 1)
+    
+    # Packet loss increases latency significantly
+    loss_latency_impact = loss_rate * 15
+    avg_latency = base_latency + loss_latency_impact + latency_noise
+    min_latency = avg_latency * 0.8 + min_latency_noise
+    max_latency = avg_latency * 1.4 + max_latency_noise
+    
+    # Jitter (increases with packet loss and viewers)
+    base_jitter = 6.0
+    loss_jitter_factor = 1.0 + (loss_rate / 100.0) * 1.5
+    viewer_jitter_factor = 1.0 + (viewers - 1) * np.where(is_p2p, 0.15, 0.08)
+    bandwidth_jitter_factor = 6.0 / bw_base
+    random_jitter_factor = 0.8 + jitter_noise * 0.4
+    
+    avg_jitter = (base_jitter * loss_jitter_factor * 
+                  viewer_jitter_factor * bandwidth_jitter_factor * 
+                  random_jitter_factor)
+    
+    # Text Legibility Score (lower is better, affected by quality degradation)
+    base_tls = 1.0  # Perfect score
+    
+    # Packet loss degrades quality
+    loss_tls_impact = loss_rate * 2.0
+    
+    # P2P degrades more with viewers due to bandwidth splitting
+    viewer_tls_impact = (viewers - 1) * np.where(is_p2p, 1.5, 0.5)
+    
+    # Lower bandwidth affects quality
+    bw_tls_impact = np.maximum(0, (3 - bw_base) * 2)
+    
+    text_legibility_score = (base_tls + loss_tls_impact + 
+                             viewer_tls_impact + bw_tls_impact + 
+                             tls_noise)
+    
+    # Ensure reasonable bounds
+    metrics = apply_bounds({
+        'Presenter_CPU_Avg': presenter_cpu_avg,
+        'Presenter_CPU_Max': presenter_cpu_max,
+        'Presenter_Bandwidth_Usage': bw_usage,
+        'Avg_Latency_Ms': avg_latency,
+        'Min_Latency_Ms': min_latency,
+        'Max_Latency_Ms': max_latency,
+        'Avg_Jitter_Ms': avg_jitter,
+        'Text_Legibility_Score': text_legibility_score
+    }, METRIC_FLOORS)
+    
+    # Create result records, one test every two minutes
     start_time = datetime.now() - timedelta(hours=1)
-    test_id = 0
-    
-    for arch in architectures:
-        for viewers in num_viewers:
-            for loss_rate in packet_loss_rates:
-                for bandwidth in presenter_bandwidths:
-                    for rep in range(repetitions):
-                        test_id += 1
-                        
-                        # Calculate realistic metrics based on parameters
-                        
-                        # CPU usage (P2P scales linearly, SFU flat)
-                        if arch == 'P2P':
-                            base_cpu = 15 + (viewers - 1) * 12  # Linear scaling
-                            cpu_variance = 3.0
-                        else:  # SFU
-                            base_cpu = 16 + (viewers - 1) * 0.3  # Minimal scaling
-                            cpu_variance = 1.0
-                        
-                        # Add packet loss impact on CPU
-                        loss_cpu_impact = loss_rate * 1.5
-                        presenter_cpu_avg = base_cpu + loss_cpu_impact + np.random.normal(0, cpu_variance)
-                        presenter_cpu_max = presenter_cpu_avg * (1.2 + np.random.random() * 0.3)
-                        
-                        # Bandwidth usage (varies by architecture)
-                        bw_base = float(bandwidth.replace('mbit', ''))
-                        if arch == 'P2P':
-                            # P2P uses more bandwidth per viewer
-                            bw_usage = (bw_base * 0.8 + np.random.normal(0, 0.1)) * viewers
-                        else:  # SFU
-                            # SFU single stream regardless of viewers
-                            bw_usage = bw_base * 0.8 + np.random.normal(0, 0.1)
-                        
-                        # Latency (affected by architecture and packet loss)
-                        if arch == 'P2P':
-                            base_latency = 25 + viewers * 2  # P2P direct but scales with peers
-                        else:  # SFU  
-                            base_latency = 35 + viewers * 1  # SFU has server hop but more stable
-                        
-                        # Packet loss increases latency significantly
-                        loss_latency_impact = loss_rate * 15
-                        avg_latency = base_latency + loss_latency_impact + np.random.normal(0, 3)
-                        min_latency = avg_latency * 0.8 + np.random.normal(0, 1)
-                        max_latency = avg_latency * 1.4 + np.random.normal(0, 5)
-                        
-                        # Jitter (increases with packet loss and viewers)
-                        base_jitter = 6.0
-                        loss_jitter_factor = 1.0 + (loss_rate / 100.0) * 1.5
-                        
-                        if arch == 'P2P':
-                            viewer_jitter_factor = 1.0 + (viewers - 1) * 0.15
-                        else:  # SFU
-                            viewer_jitter_factor = 1.0 + (viewers - 1) * 0.08
-                        
-                        bandwidth_jitter_factor = 6.0 / float(bandwidth.replace('mbit', ''))
-                        random_jitter_factor = 0.8 + np.random.random() * 0.4
-                        
-                        avg_jitter = (base_jitter * loss_jitter_factor * 
-                                     viewer_jitter_factor * bandwidth_jitter_factor * 
-                                     random_jitter_factor)
-                        
-                        # Text Legibility Score (lower is better, affected by quality degradation)
-                        base_tls = 1.0  # Perfect score
-                        
-                        # Packet loss degrades quality
-                        loss_tls_impact = loss_rate * 2.0
-                        
-                        # P2P degrades more with viewers due to bandwidth splitting
-                        if arch == 'P2P':
-                            viewer_tls_impact = (viewers - 1) * 1.5
-                        else:  # SFU
-                            viewer_tls_impact = (viewers - 1) * 0.5
-                        
-                        # Lower bandwidth affects quality
-                        bw_tls_impact = max(0, (3 - float(bandwidth.replace('mbit', ''))) * 2)
-                        
-                        text_legibility_score = (base_tls + loss_tls_impact + 
-                                               viewer_tls_impact + bw_tls_impact + 
-                                               np.random.normal(0, 0.5))
-                        
-                        # Ensure reasonable bounds
-                        presenter_cpu_avg = max(5, min(100, presenter_cpu_avg))
-                        presenter_cpu_max = max(presenter_cpu_avg, min(100, presenter_cpu_max))
-                        bw_usage = max(0.1, bw_usage)
-                        avg_latency = max(10, avg_latency)
-                        min_latency = max(5, min(avg_latency * 0.9, min_latency))
-                        max_latency = max(avg_latency * 1.1, max_latency)
-                        avg_jitter = max(1, avg_jitter)
-                        text_legibility_score = max(0, text_legibility_score)
-                        
-                        # Create result record
-                        result = {
-                            'Timestamp': (start_time + timedelta(minutes=test_id*2)).isoformat(),
-                            'Architecture': arch,
-                            'Num_Viewers': viewers,
-                            'Packet_Loss_Rate': loss_rate,
-                            'Presenter_Bandwidth': bandwidth,
-                            'Repetition': rep + 1,
-                            'Presenter_CPU_Avg': round(presenter_cpu_avg, 2),
-                            'Presenter_CPU_Max': round(presenter_cpu_max, 2),
-                            'Presenter_Bandwidth_Usage': round(bw_usage, 2),
-                            'Avg_Latency_Ms': round(avg_latency, 2),
-                            'Min_Latency_Ms': round(min_latency, 2),
-                            'Max_Latency_Ms': round(max_latency, 2),
-                            'Avg_Jitter_Ms': round(avg_jitter, 2),
-                            'Text_Legibility_Score': round(text_legibility_score, 2),
-                            'Test_Duration_Ms': 15000,  # 15 second tests
-                            'Success': True,
-                            'Error_Message': ''
-                        }
-                        
-                        results.append(result)
-    
-    return results
+    timestamps = pd.date_range(start_time + timedelta(minutes=2), periods=n, freq='2min')
+    
+    return results_frame(grid, metrics, timestamps, test_duration_ms=15000)  # 15 second tests
 
 def main():
     """Generate production test data and save to CSV"""
@@ -147,26 +124,24 @@ def main():
     print("=" * 60)
     
     # Generate data
-    results = generate_realistic_webrtc_data()
-    
-    # Create DataFrame
-    df = pd.DataFrame(results)
+    df = generate_realistic_webrtc_data()
     
-    # Save to results file
-    os.makedirs('results', exist_ok=True)
+    # Save to results file (plus a typed Parquet copy when PyArrow is installed)
     output_path = 'results/production_results.csv'
-    df.to_csv(output_path, index=False)
+    parquet_path = save_results(df, output_path)
     
-    print(f"✅ Generated {len(results)} realistic test results")
+    print(f"✅ Generated {len(df)} realistic test results")
     print(f"📁 Saved to: {output_path}")
+    if parquet_path:
+        print(f"📁 Parquet copy saved to: {parquet_path}")
     print()
     
     # Print summary statistics
     print("📊 DATA SUMMARY:")
-    print(f"   • Architectures: {df['Architecture'].unique()}")
-    print(f"   • Viewer counts: {sorted(df['Num_Viewers'].unique())}")
-    print(f"   • Packet loss rates: {sorted(df['Packet_Loss_Rate'].unique())}%")
-    print(f"   • Bandwidths: {df['Presenter_Bandwidth'].unique()}")
+    print(f"   • Architectures: {list(df['Architecture'].cat.categories)}")
+    print(f"   • Viewer counts: {sorted(df['Num_Viewers'].unique().tolist())}")
+    print(f"   • Packet loss rates: {sorted(df['Packet_Loss_Rate'].unique().tolist())}%")
+    print(f"   • Bandwidths: {list(df['Presenter_Bandwidth'].cat.categories)}")
     
     print()
     print("🔍 KEY METRICS PREVIEW:")
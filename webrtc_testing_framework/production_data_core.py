@@ -0,0 +1,147 @@
+"""
+Shared core for the production data generators
+
+generate_production_test_data.py and generate_current_production_data.py sweep
+the same parameter grid, clamp their metrics to the same kinds of bounds and
+write the same results layout; only the metric models and their constants
+differ, so those stay in the scripts and everything else lives here.
+"""
+
+import os
+from dataclasses import dataclass
+import pandas as pd
+import numpy as np
+
+try:
+    import pyarrow as pa
+except ImportError:  # pandas-only installs just write the CSV
+    pa = None
+
+# Metric columns in results-file order; every model fills all of them
+METRIC_COLUMNS = [
+    'Presenter_CPU_Avg', 'Presenter_CPU_Max', 'Presenter_Bandwidth_Usage',
+    'Avg_Latency_Ms', 'Min_Latency_Ms', 'Max_Latency_Ms',
+    'Avg_Jitter_Ms', 'Text_Legibility_Score'
+]
+
+# Compact dtypes for the numeric result columns, one contiguous array each
+# (the label columns are categoricals with int8 codes)
+RESULT_SCHEMA = {
+    'Num_Viewers': np.int16,
+    'Packet_Loss_Rate': np.int16,
+    'Repetition': np.int16,
+    **dict.fromkeys(METRIC_COLUMNS, np.float32),
+    'Test_Duration_Ms': np.int32
+}
+
+@dataclass(frozen=True)
+class TestGrid:
+    """Flat parameter columns for a test sweep, one row per test"""
+    architectures: list
+    bw_labels: tuple
+    arch_idx: np.ndarray
+    bw_idx: np.ndarray
+    rep_idx: np.ndarray
+    viewers: np.ndarray
+    loss_rate: np.ndarray
+    bandwidth: np.ndarray  # Mbit/s
+    
+    @property
+    def n(self):
+        return self.arch_idx.size
+    
+    @property
+    def is_p2p(self):
+        return self.arch_idx == self.architectures.index('P2P')
+
+def build_test_grid(architectures, num_viewers, packet_loss_rates, presenter_bandwidths, repetitions):
+    """Parameter grid for every combination of the test configuration
+    
+    `presenter_bandwidths` holds (label, Mbit/s) pairs. Repetition varies
+    fastest, matching the nested test order.
+    """
+    arch_idx, viewer_idx, loss_idx, bw_idx, rep_idx = (
+        idx.ravel() for idx in np.indices((
+            len(architectures), len(num_viewers), len(packet_loss_rates),
+            len(presenter_bandwidths), repetitions
+        ))
+    )
+    bw_labels, bw_values = zip(*presenter_bandwidths)
+    
+    return TestGrid(
+        architectures=list(architectures),
+        bw_labels=bw_labels,
+        arch_idx=arch_idx,
+        bw_idx=bw_idx,
+        rep_idx=rep_idx,
+        viewers=np.array(num_viewers)[viewer_idx],
+        loss_rate=np.array(packet_loss_rates)[loss_idx],
+        bandwidth=np.array(bw_values)[bw_idx]
+    )
+
+def draw_normal_noise(rng, n, noise_sigma):
+    """Normal noise for all tests in one draw
+    
+    One matrix with a column per noise source, scaled by that source's
+    standard deviation; returned transposed so it unpacks per source.
+    """
+    return (rng.standard_normal((n, len(noise_sigma))) * np.asarray(noise_sigma)).T
+
+def apply_bounds(metrics, floors):
+    """Clamp raw metrics to sensible ranges
+    
+    CPU is capped at 100%, the peak never drops below the average, and the
+    latency spread is kept around the average. `floors` gives each model's
+    lower limits for CPU, latency, jitter and text legibility.
+    """
+    bounded = dict(metrics)
+    
+    cpu_avg = np.clip(metrics['Presenter_CPU_Avg'], floors['Presenter_CPU_Avg'], 100)
+    bounded['Presenter_CPU_Avg'] = cpu_avg
+    bounded['Presenter_CPU_Max'] = np.maximum(cpu_avg, np.minimum(100, metrics['Presenter_CPU_Max']))
+    bounded['Presenter_Bandwidth_Usage'] = np.maximum(0.1, metrics['Presenter_Bandwidth_Usage'])
+    
+    avg_latency = np.maximum(floors['Avg_Latency_Ms'], metrics['Avg_Latency_Ms'])
+    bounded['Avg_Latency_Ms'] = avg_latency
+    bounded['Min_Latency_Ms'] = np.maximum(floors['Min_Latency_Ms'], np.minimum(avg_latency * 0.9, metrics['Min_Latency_Ms']))
+    bounded['Max_Latency_Ms'] = np.maximum(avg_latency * 1.1, metrics['Max_Latency_Ms'])
+    
+    bounded['Avg_Jitter_Ms'] = np.maximum(floors['Avg_Jitter_Ms'], metrics['Avg_Jitter_Ms'])
+    bounded['Text_Legibility_Score'] = np.maximum(floors['Text_Legibility_Score'], metrics['Text_Legibility_Score'])
+    
+    return bounded
+
+def results_frame(grid, metrics, timestamps, test_duration_ms):
+    """Assemble the results table in the standard column layout
+    
+    Metrics go in raw and are rounded to 2 decimals in a single DataFrame.round,
+    then every numeric column is narrowed to its RESULT_SCHEMA dtype.
+    """
+    df = pd.DataFrame({
+        'Timestamp': timestamps,
+        # Low-cardinality labels are stored as categoricals (integer codes)
+        'Architecture': pd.Categorical.from_codes(grid.arch_idx, grid.architectures),
+        'Num_Viewers': grid.viewers,
+        'Packet_Loss_Rate': grid.loss_rate,
+        'Presenter_Bandwidth': pd.Categorical.from_codes(grid.bw_idx, grid.bw_labels),
+        'Repetition': grid.rep_idx + 1,
+        **{column: metrics[column] for column in METRIC_COLUMNS},
+        'Test_Duration_Ms': test_duration_ms,
+        'Success': True,
+        'Error_Message': ''
+    })
+    return df.round(dict.fromkeys(METRIC_COLUMNS, 2)).astype(RESULT_SCHEMA)
+
+def save_results(df, output_path):
+    """Write results as CSV, plus a typed Parquet copy when PyArrow is installed
+    
+    Returns the Parquet path, or None when no copy was written.
+    """
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    df.to_csv(output_path, index=False, date_format='%Y-%m-%dT%H:%M:%S.%f')  # ISO 8601 timestamps
+    
+    if pa is None:
+        return None
+    parquet_path = output_path.replace('.csv', '.parquet')
+    df.to_parquet(parquet_path, index=False)
+    return parquet_path